@@ -7,8 +7,11 @@ of the system to work with different display types (BLE, WiFi, serial, etc.) thr
 a common interface.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Union
-from PIL import Image
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    # Only needed for annotations; keeps Pillow out of the import path
+    from PIL import Image
 
 
 class DisplayAdapter(ABC):
@@ -19,6 +22,9 @@ class DisplayAdapter(ABC):
     This ensures consistent behavior across different display protocols.
     """
 
+    # No instance state here, so subclasses may use __slots__ to drop the per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     async def connect(self) -> None:
         """
@@ -45,7 +51,8 @@ class DisplayAdapter(ABC):
         pass
 
     @abstractmethod
-    async def upload_image(self, image: Image, clear_first: bool = False, panels: list = None) -> None:
+    async def upload_image(self, image: "Image.Image", clear_first: bool = False, panels: list = None,
+                           cache_key: Optional[tuple] = None) -> None:
         """
         Upload a PIL Image to the display device(s).
 
@@ -54,6 +61,9 @@ class DisplayAdapter(ABC):
             clear_first: If True, clear screen before uploading
             panels: List of panel indices (0-based). None or [] = all panels.
                     Example: [0] = panel 0, [0, 1] = panels 0 and 1
+            cache_key: Optional hashable key identifying the image content. Images
+                       with the same key are identical, so adapters may reuse their
+                       encoded form instead of re-encoding. Adapters may ignore it.
 
         The adapter should handle:
         - Image format conversion if needed
@@ -5,20 +5,109 @@ This adapter implements the DisplayAdapter interface for BLE-connected iPixel LE
 It handles multi-panel configurations (1, 2, 3+ panels) and uses PNG upload for fast display updates.
 """
 import asyncio
+import functools
+import hashlib
 import logging
-from typing import Optional, List
-
-from bleak import BleakClient
-from PIL import Image
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from ..base import DisplayAdapter, ConnectionError, UploadError
 
+if TYPE_CHECKING:
+    from bleak import BleakClient
+
 logger = logging.getLogger('led_panel.adapter.ipixel')
 from .protocol import (
     MultiPanelClient, _get_panel_addresses, set_panel_dimensions,
-    clear_screen_completely, init_panels, upload_png, upload_gif, led_on, led_off
+    clear_screen_completely, init_panels, upload_gif, led_on, led_off,
+    encode_png_packets, send_png_packets, write_cmd, CLEAR_SCREEN
 )
 
+# Protocol dimensions only need to be configured once per process
+_dims_configured = False
+
+# Encoded packet sets kept for upload_image(cache_key=...)
+ENCODED_CACHE_SIZE = 8
+
+# _retry() attempts for transient BLE errors; delays are RETRY_BASE_DELAY * 3**n (100/300/900 ms)
+RETRY_TRIES = 3
+RETRY_BASE_DELAY = 0.1
+
+# ensure_connected() reconnect attempts and the first backoff delay (doubles each retry)
+RECONNECT_ATTEMPTS = 3
+RECONNECT_BACKOFF = 0.5
+
+
+@functools.lru_cache(maxsize=1)
+def _get_bleak():
+    """Import bleak on first use (only connect() needs it) and return BleakClient."""
+    try:
+        from bleak import BleakClient
+    except ImportError as e:
+        raise ConnectionError(f"bleak is required for BLE panels: {e}") from e
+    return BleakClient
+
+
+async def _acquire_mtu(client) -> None:
+    """
+    Best-effort: make the negotiated ATT MTU visible to bleak.
+
+    On BlueZ the MTU exchange happens in the background and bleak reports the
+    23-byte default until asked; _acquire_mtu() (the workaround bleak documents)
+    fetches the real value so writes can be sent in full-size chunks. Other
+    backends already report the negotiated MTU.
+    """
+    backend = getattr(client, "_backend", None)
+    acquire = getattr(backend, "_acquire_mtu", None)
+    if acquire is not None:
+        try:
+            await acquire()
+        except Exception as e:
+            logger.debug(f"Could not acquire MTU for {client.address}: {e}")
+    logger.debug(f"Panel {client.address}: MTU {getattr(client, 'mtu_size', 'unknown')}")
+
+
+@functools.lru_cache(maxsize=1)
+def _transient_errors() -> tuple:
+    """Exception types worth retrying: BLE stack errors and timeouts."""
+    errors = [asyncio.TimeoutError, TimeoutError]
+    try:
+        from bleak.exc import BleakError
+        errors.append(BleakError)
+    except ImportError:
+        pass
+    return tuple(errors)
+
+
+def __getattr__(name):
+    # bleak is imported lazily; cache it in globals on first access
+    if name == 'BleakClient':
+        BleakClient = _get_bleak()
+        globals()['BleakClient'] = BleakClient
+        return BleakClient
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def _require_connected(err_cls, msg):
+    """
+    Decorator for adapter operations that need a live connection.
+
+    Raises ConnectionError when not connected, transparently reconnects sessions
+    whose panels dropped, and wraps any failure of the decorated coroutine in
+    err_cls (prefixed with msg).
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            if not self._connected or self.client is None:
+                raise ConnectionError("Not connected to display")
+            await self.ensure_connected()
+            try:
+                return await fn(self, *args, **kwargs)
+            except Exception as e:
+                raise err_cls(f"{msg}: {e}") from e
+        return wrapper
+    return decorator
+
 
 class BLEDisplayAdapter(DisplayAdapter):
     """
@@ -28,16 +117,32 @@ class BLEDisplayAdapter(DisplayAdapter):
     Panel dimensions, count, and addresses are configured via config.yml.
     """
 
+    __slots__ = ('panel_clients', 'client', '_connected', '_last_hashes', '_encoded_cache',
+                 'panel_width', 'panel_height', '_info_template')
+
     def __init__(self):
-        self.panel_clients: List[Optional[BleakClient]] = []
+        self.panel_clients: Tuple["BleakClient", ...] = ()
         self.client: Optional[MultiPanelClient] = None
+        # True once every panel is connected and initialized (connect() is all-or-nothing)
         self._connected = False
+        # panel index -> digest of the last PNG packet sent to it (see upload_image)
+        self._last_hashes = {}
+        # (cache_key, panel_count, panels) -> (packets, digests), oldest first
+        self._encoded_cache = {}
         
         # Load panel dimensions from config
         self._load_panel_dimensions()
     
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget cached panel addresses and dimensions (e.g. after config.yml is reloaded)."""
+        global _dims_configured
+        _get_panel_addresses.cache_clear()
+        _dims_configured = False
+
     def _load_panel_dimensions(self):
         """Load panel width and height from centralized config and configure protocol"""
+        global _dims_configured
         try:
             # Import from centralized config module
             from config import IPIXEL_PANEL_WIDTH, IPIXEL_PANEL_HEIGHT
@@ -46,7 +151,9 @@ class BLEDisplayAdapter(DisplayAdapter):
             self.panel_height = IPIXEL_PANEL_HEIGHT
             
             # Configure protocol layer with these dimensions
-            set_panel_dimensions(self.panel_width, self.panel_height)
+            if not _dims_configured:
+                set_panel_dimensions(self.panel_width, self.panel_height)
+                _dims_configured = True
             
         except Exception as e:
             # Fallback to defaults if config not available
@@ -54,25 +161,72 @@ class BLEDisplayAdapter(DisplayAdapter):
             self.panel_height = 20
             logger.warning(f"Failed to load panel dimensions, using defaults (64x20): {e}")
             set_panel_dimensions(64, 20)
+            _dims_configured = True
+
+        # Static part of get_info(); only device count and height change after connect
+        self._info_template = {
+            "adapter_type": "ipixel",
+            "panel_width": self.panel_width,
+            "panel_height": self.panel_height,
+            "total_width": self.panel_width,
+            "protocol": "iPixel BLE",
+            "features": ["png_upload", "dual_panel", "fast_refresh"]
+        }
 
     async def connect(self) -> None:
-        """Establish BLE connections to all configured LED panels."""
+        """
+        Establish BLE connections to all configured LED panels.
+
+        A session whose links are all still up is reused as-is (no reconnect,
+        no GATT discovery, no re-init). Otherwise whatever is left of the old
+        session is disconnected first: the panels accept only one central.
+        """
+        if self._links_alive():
+            logger.debug("Reusing existing BLE session")
+            return
+
+        if self.client:
+            await self.client.disconnect()
+
         try:
+            BleakClient = _get_bleak()
+
             # Get configured panel addresses
             addresses = _get_panel_addresses()
             panel_count = len(addresses)
             
             logger.info(f"Connecting to {panel_count} LED panel(s)...")
 
-            # Create and connect BLE clients for each panel
-            for i, address in enumerate(addresses):
-                client = BleakClient(address)
-                await client.connect()
-                self.panel_clients.append(client)
-                logger.info(f"Connected to panel {i+1}/{panel_count}")
+            # Create BLE clients for each panel and connect them concurrently
+            # (connection setup is radio-bound, so N panels take ~max(T) instead of sum(T))
+            clients = [BleakClient(address) for address in addresses]
+            results = await asyncio.gather(
+                *(client.connect() for client in clients),
+                return_exceptions=True
+            )
+
+            failed = []
+            for i, result in enumerate(results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Failed to connect to panel {i+1}/{panel_count}: {result}")
+                    failed.append(i)
+                else:
+                    logger.info(f"Connected to panel {i+1}/{panel_count}")
+
+            if failed:
+                # Best-effort cleanup of the panels that did connect
+                await asyncio.gather(
+                    *(client.disconnect() for i, client in enumerate(clients) if i not in failed),
+                    return_exceptions=True
+                )
+                raise ConnectionError(f"Could not connect to panel(s) {[i + 1 for i in failed]}")
 
+            self.panel_clients = tuple(clients)
             logger.info(f"Connected to all {panel_count} panel(s)!")
 
+            # Make sure chunk sizes reflect the negotiated MTU, not the 23-byte default
+            await asyncio.gather(*(_acquire_mtu(client) for client in clients))
+
             # Create multi-panel wrapper
             self.client = MultiPanelClient(self.panel_clients)
 
@@ -80,11 +234,46 @@ class BLEDisplayAdapter(DisplayAdapter):
             await init_panels(self.client)
 
             self._connected = True
+            self._last_hashes.clear()
 
         except Exception as e:
             self._connected = False
             raise ConnectionError(f"Failed to connect to BLE panels: {e}") from e
 
+    def _links_alive(self) -> bool:
+        """True if the session is connected and every panel's BleakClient still reports connected."""
+        return (
+            self._connected
+            and bool(self.panel_clients)
+            and all(client.is_connected for client in self.panel_clients)
+        )
+
+    async def ensure_connected(self) -> None:
+        """
+        Make sure every panel link is up, reconnecting a stale session if needed.
+
+        Retries RECONNECT_ATTEMPTS times with exponential backoff before giving up.
+
+        Raises:
+            ConnectionError: If the panels could not be reconnected
+        """
+        if self._links_alive():
+            return
+
+        logger.warning("BLE session went stale, reconnecting...")
+        delay = RECONNECT_BACKOFF
+        for attempt in range(1, RECONNECT_ATTEMPTS + 1):
+            try:
+                # connect() drops whatever is left of the old session first
+                await self.connect()
+                return
+            except ConnectionError as e:
+                logger.warning(f"Reconnect attempt {attempt}/{RECONNECT_ATTEMPTS} failed: {e}")
+                if attempt == RECONNECT_ATTEMPTS:
+                    raise
+                await asyncio.sleep(delay)
+                delay *= 2
+
     async def disconnect(self) -> None:
         """Close BLE connections."""
         if self.client:
@@ -92,7 +281,30 @@ class BLEDisplayAdapter(DisplayAdapter):
         self._connected = False
         logger.info("Disconnected from panels")
 
-    async def upload_image(self, image, clear_first: bool = False, panels: list = None) -> None:
+    async def _retry(self, coro_fn, tries: int = RETRY_TRIES, base_delay: float = RETRY_BASE_DELAY):
+        """
+        Run coro_fn() and retry it on transient BLE errors (BleakError, timeouts).
+
+        Waits base_delay * 3**n between attempts. If a panel link dropped, the
+        session is re-established via ensure_connected() before the next attempt.
+        Any other exception, or the last transient one, is raised.
+        """
+        for attempt in range(tries):
+            try:
+                return await coro_fn()
+            except _transient_errors() as e:
+                if attempt == tries - 1:
+                    raise
+                delay = base_delay * 3 ** attempt
+                logger.warning(f"BLE operation failed ({e}), retrying in {delay * 1000:.0f} ms")
+                await asyncio.sleep(delay)
+                if not self._links_alive():
+                    await self.ensure_connected()
+
+    @_require_connected(UploadError, "Failed to upload image")
+    async def upload_image(self, image, clear_first: bool = False, panels: list = None,
+                           cache_key: Optional[tuple] = None, parallel: bool = True,
+                           always_send: bool = False) -> None:
         """
         Upload PIL Image to panels using PNG upload.
         
@@ -101,15 +313,100 @@ class BLEDisplayAdapter(DisplayAdapter):
             clear_first: Clear screen before uploading
             panels: List of panel indices (0-based). None or [] = all panels.
                     Example: [0] = panel 0, [0, 1] = panels 0 and 1
+            cache_key: Hashable key for the image content (e.g. theme + minute for the
+                       clock). Packets encoded for a key are reused on later calls with
+                       the same key, skipping the encode entirely.
+            parallel: Write the panels concurrently (default). Set False to write
+                      them one after another, e.g. on a BLE adapter that struggles
+                      with several simultaneous links.
+            always_send: Upload even to panels already showing this exact content
+
+        Encoding runs in a worker thread and the per-panel BLE writes are issued
+        concurrently (each panel has its own link). Panels whose packet is identical
+        to the last one sent to them are skipped, so unchanged frames cost no BLE traffic.
+        """
+        if clear_first:
+            await write_cmd(self.client, CLEAR_SCREEN)
+            await asyncio.sleep(0.1)
+            self._last_hashes.clear()
+
+        encoded_key = None
+        if cache_key is not None:
+            encoded_key = (cache_key, self.client.panel_count, tuple(panels) if panels else ())
+        cached = self._encoded_cache.get(encoded_key) if encoded_key is not None else None
+
+        if cached is not None:
+            packets, digests = cached
+        else:
+            loop = asyncio.get_event_loop()
+            packets = await loop.run_in_executor(
+                None, encode_png_packets, image, self.client.panel_count, panels
+            )
+            # Packets are a deterministic function of the pixels, so equal digests mean equal frames
+            digests = [hashlib.blake2b(packet, digest_size=8).digest() for _, packet in packets]
+            if encoded_key is not None:
+                if len(self._encoded_cache) >= ENCODED_CACHE_SIZE:
+                    del self._encoded_cache[next(iter(self._encoded_cache))]
+                self._encoded_cache[encoded_key] = (packets, digests)
+        if not always_send:
+            changed = [i for i, (panel_idx, _) in enumerate(packets)
+                       if self._last_hashes.get(panel_idx) != digests[i]]
+            if not changed:
+                logger.debug("Frame unchanged on all target panels, skipping upload")
+                return
+            packets = [packets[i] for i in changed]
+            digests = [digests[i] for i in changed]
+
+        await self._retry(lambda: send_png_packets(self.client, packets, parallel))
+        for (panel_idx, _), digest in zip(packets, digests):
+            self._last_hashes[panel_idx] = digest
+
+    @_require_connected(UploadError, "Failed to upload frames")
+    async def upload_frames(self, images, clear_first: bool = False, panels: list = None) -> None:
+        """
+        Upload a sequence of PIL Images back to back (slideshows, animations).
+
+        Frames are double-buffered: PNG encoding of the next frame runs in a
+        worker thread while the previous frame is being written over BLE.
+
+        Args:
+            images: Iterable of PIL Images
+            clear_first: Clear screen before the first frame
+            panels: List of panel indices (0-based). None or [] = all panels.
         """
-        if not self._connected or not self.client:
-            raise ConnectionError("Not connected to display")
+        loop = asyncio.get_event_loop()
+        queue = asyncio.Queue(maxsize=2)
+        panel_count = self.client.panel_count
 
+        async def produce():
+            try:
+                for image in images:
+                    packets = await loop.run_in_executor(None, encode_png_packets, image, panel_count, panels)
+                    await queue.put(packets)
+                await queue.put(None)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await queue.put(e)
+
+        if clear_first:
+            await write_cmd(self.client, CLEAR_SCREEN)
+            await asyncio.sleep(0.1)
+
+        self._last_hashes.clear()
+        producer = asyncio.ensure_future(produce())
         try:
-            await upload_png(self.client, image, clear_first, panels)
-        except Exception as e:
-            raise UploadError(f"Failed to upload image: {e}") from e
+            while True:
+                packets = await queue.get()
+                if packets is None:
+                    break
+                if isinstance(packets, Exception):
+                    raise packets
+                await send_png_packets(self.client, packets)
+        finally:
+            producer.cancel()
 
+    @_require_connected(UploadError, "Failed to upload GIF")
     async def upload_gif(self, gif_path_or_data, clear_first: bool = False, max_frames: Optional[int] = None, panels: list = None) -> None:
         """
         Upload GIF animation to panels.
@@ -121,43 +418,26 @@ class BLEDisplayAdapter(DisplayAdapter):
             panels: List of panel indices (0-based). None or [] = all panels.
                     Example: [0] = panel 0, [0, 1] = panels 0 and 1
         """
-        if not self._connected or not self.client:
-            raise ConnectionError("Not connected to display")
-
-        try:
-            await upload_gif(self.client, gif_path_or_data, clear_first, max_frames, panels)
-        except Exception as e:
-            raise UploadError(f"Failed to upload GIF: {e}") from e
+        self._last_hashes.clear()
+        await upload_gif(self.client, gif_path_or_data, clear_first, max_frames, panels)
 
+    @_require_connected(UploadError, "Failed to clear screen")
     async def clear_screen(self) -> None:
         """Clear the display screens."""
-        if not self._connected or not self.client:
-            raise ConnectionError("Not connected to display")
-
-        try:
-            await clear_screen_completely(self.client)
-        except Exception as e:
-            raise UploadError(f"Failed to clear screen: {e}") from e
+        self._last_hashes.clear()
+        await self._retry(lambda: clear_screen_completely(self.client))
 
+    @_require_connected(UploadError, "Failed to turn on display")
     async def power_on(self) -> None:
         """Turn the displays on."""
-        if not self._connected or not self.client:
-            raise ConnectionError("Not connected to display")
-
-        try:
-            await led_on(self.client)
-        except Exception as e:
-            raise UploadError(f"Failed to turn on display: {e}") from e
+        self._last_hashes.clear()
+        await self._retry(lambda: led_on(self.client))
 
+    @_require_connected(UploadError, "Failed to turn off display")
     async def power_off(self) -> None:
         """Turn the displays off."""
-        if not self._connected or not self.client:
-            raise ConnectionError("Not connected to display")
-
-        try:
-            await led_off(self.client)
-        except Exception as e:
-            raise UploadError(f"Failed to turn off display: {e}") from e
+        self._last_hashes.clear()
+        await self._retry(lambda: led_off(self.client))
 
     @property
     def display_width(self) -> int:
@@ -176,15 +456,16 @@ class BLEDisplayAdapter(DisplayAdapter):
         """Check if connected to displays."""
         return self._connected
 
+    @property
+    def connected_count(self) -> int:
+        """Number of panels currently connected."""
+        return len(self.panel_clients) if self._connected else 0
+
     async def get_info(self) -> dict:
         """Get adapter information."""
         return {
-            "adapter_type": "ipixel",
-            "device_count": 2,
-            "panel_width": DISPLAY_WIDTH,
-            "panel_height": DISPLAY_HEIGHT,
-            "total_width": self.display_width,
+            **self._info_template,
+            "device_count": self.client.panel_count if self.client else len(self.panel_clients),
             "total_height": self.display_height,
-            "protocol": "iPixel BLE",
-            "features": ["png_upload", "dual_panel", "fast_refresh"]
         }
+
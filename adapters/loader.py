@@ -28,18 +28,38 @@ class AdapterRegistry:
 
         self.registry_path = registry_path
         self._registry: Optional[Dict[str, Any]] = None
+        self._mtime: Optional[float] = None
+        # adapter name -> resolved adapter class (cleared when the registry file changes)
+        self._class_cache: Dict[str, Type[DisplayAdapter]] = {}
 
     def load_registry(self) -> Dict[str, Any]:
-        """Load the adapter registry from JSON file."""
-        if self._registry is None:
+        """
+        Load the adapter registry from JSON file.
+
+        The parsed registry is cached and only re-read when the file's mtime changes,
+        so long-running processes pick up edits to adapters.json.
+        """
+        try:
+            mtime = self.registry_path.stat().st_mtime
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Adapter registry not found: {self.registry_path}")
+
+        if self._registry is None or mtime != self._mtime:
             try:
                 with open(self.registry_path, 'r') as f:
-                    self._registry = json.load(f)
+                    registry = json.load(f)
             except FileNotFoundError:
                 raise FileNotFoundError(f"Adapter registry not found: {self.registry_path}")
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid adapter registry JSON: {e}")
 
+            if not isinstance(registry, dict) or not isinstance(registry.get('adapters', {}), dict):
+                raise ValueError(f"Invalid adapter registry: 'adapters' must be an object in {self.registry_path}")
+
+            self._registry = registry
+            self._mtime = mtime
+            self._class_cache.clear()
+
         return self._registry
 
     def get_adapter_info(self, adapter_name: str) -> Dict[str, Any]:
@@ -81,15 +101,15 @@ class AdapterRegistry:
         registry = self.load_registry()
         return registry.get('adapters', {})
 
-    def create_adapter(self, adapter_name: Optional[str] = None) -> DisplayAdapter:
+    def get_adapter_class(self, adapter_name: Optional[str] = None) -> Type[DisplayAdapter]:
         """
-        Create and return an instance of the specified adapter.
+        Resolve (import) the class for an adapter, caching it per name.
 
         Args:
-            adapter_name: Name of adapter to create. If None, uses default adapter.
+            adapter_name: Name of adapter. If None, uses default adapter.
 
         Returns:
-            DisplayAdapter instance
+            DisplayAdapter subclass
 
         Raises:
             KeyError: If adapter not found
@@ -103,6 +123,10 @@ class AdapterRegistry:
 
         info = self.get_adapter_info(adapter_name)
 
+        adapter_class = self._class_cache.get(adapter_name)
+        if adapter_class is not None:
+            return adapter_class
+
         # Import the module
         module_name = info['module']
         class_name = info['class']
@@ -122,13 +146,37 @@ class AdapterRegistry:
         if not issubclass(adapter_class, DisplayAdapter):
             raise TypeError(f"Adapter class '{class_name}' is not a DisplayAdapter subclass")
 
-        # Create and return instance
-        return adapter_class()
+        self._class_cache[adapter_name] = adapter_class
+        return adapter_class
+
+    def create_adapter(self, adapter_name: Optional[str] = None) -> DisplayAdapter:
+        """
+        Create and return an instance of the specified adapter.
+
+        Args:
+            adapter_name: Name of adapter to create. If None, uses default adapter.
+
+        Returns:
+            DisplayAdapter instance
+
+        Raises:
+            KeyError: If adapter not found
+            ImportError: If adapter module/class cannot be imported
+            TypeError: If imported class is not a DisplayAdapter
+        """
+        return self.get_adapter_class(adapter_name)()
 
 
 # Global registry instance
 _registry = AdapterRegistry()
 
+# Read and validate the registry up front so the first caller doesn't pay for it
+try:
+    _registry.load_registry()
+except (FileNotFoundError, ValueError):
+    # Reported again (with the same message) when the registry is actually used
+    pass
+
 def get_adapter(adapter_name: Optional[str] = None) -> DisplayAdapter:
     """
     Convenience function to get an adapter instance.
@@ -12,7 +12,7 @@ This avoids having config loading code scattered throughout the codebase.
 
 import logging
 from config_loader import load_config
-from typing import List, Dict, Any
+from typing import Any, Dict, Tuple
 
 logger = logging.getLogger('led_panel.config')
 
@@ -24,79 +24,91 @@ except Exception as e:
     raise RuntimeError("Configuration failed to load. Check config.yml exists and is valid YAML.")
 
 # ============================================================================
-# DISPLAY ADAPTER SETTINGS
-# ============================================================================
-ADAPTER_TYPE: str = _cfg.get_string("display.adapter", "ipixel")
-
-# iPixel Panel Settings
-IPIXEL_BLE_ADDRESSES: List[str] = _cfg.get_list("display.ipixel.ble_addresses", [])
-IPIXEL_BLE_UUID_WRITE: str = _cfg.get_string("display.ipixel.ble_uuid_write", "0000fa02-0000-1000-8000-00805f9b34fb")
-IPIXEL_PANEL_WIDTH: int = _cfg.get_int("display.ipixel.size_width", 64)
-IPIXEL_PANEL_HEIGHT: int = _cfg.get_int("display.ipixel.size_height", 20)
-
-# ============================================================================
-# WEATHER SETTINGS
-# ============================================================================
-WEATHER_API_KEY: str = _cfg.get_string("weather.api_key", "your-api-key-here")
-WEATHER_CITY: str = _cfg.get_string("weather.city", "Detroit,US")
-WEATHER_UNITS: str = _cfg.get_string("weather.units", "imperial")
-WEATHER_FORECAST_MODE: str = _cfg.get_string("weather.forecast_mode", "daily")
-WEATHER_SHOW_ICONS: bool = _cfg.get_bool("weather.show_icons", True)
-WEATHER_CHECK_INTERVAL: int = _cfg.get_int("weather.check_interval", 1800)
-
-# ============================================================================
-# SPORTS SETTINGS
-# ============================================================================
-SPORTS_NHL_TEAMS: List[str] = _cfg.get_list("sports.teams.nhl", ["DET"])
-SPORTS_NBA_TEAMS: List[str] = _cfg.get_list("sports.teams.nba", ["DET"])
-SPORTS_NFL_TEAMS: List[str] = _cfg.get_list("sports.teams.nfl", ["DET"])
-SPORTS_MLB_TEAMS: List[str] = _cfg.get_list("sports.teams.mlb", ["DET"])
-SPORTS_TEST_MODE: bool = _cfg.get_bool("sports.test_mode", False)
-SPORTS_CHECK_INTERVAL: int = _cfg.get_int("sports.check_interval", 10)
-SPORTS_SHOW_LOGOS: bool = _cfg.get_bool("sports.show_logos", True)
-SPORTS_MODES: List[str] = _cfg.get_list("sports.modes", ["live", "upcoming"])
-
-# ============================================================================
-# STOCKS SETTINGS
-# ============================================================================
-STOCKS_SYMBOLS: List[str] = _cfg.get_list("stocks.symbols", ["AAPL", "GOOGL", "MSFT"])
-STOCKS_CHECK_INTERVAL: int = _cfg.get_int("stocks.check_interval", 300)
-
-# ============================================================================
-# TICKER SETTINGS
-# ============================================================================
-TICKER_MODES: List[str] = _cfg.get_list("ticker.modes", ["sports", "stocks"])
-TICKER_SCROLL_SPEED: int = _cfg.get_int("ticker.scroll_speed", 3)
-TICKER_REFRESH_INTERVAL: int = _cfg.get_int("ticker.refresh_interval", 30)
-TICKER_HEIGHT: int = _cfg.get_int("ticker.height", 20)
-
-# ============================================================================
-# DISPLAY MODES SETTINGS
-# ============================================================================
-DISPLAY_SPORTS_PRIORITY: bool = _cfg.get_bool("display_modes.sports_priority", True)
-DISPLAY_CYCLE_MODES: List[str] = _cfg.get_list("display_modes.cycle_modes", ["clock", "weather"])
-DISPLAY_CYCLE_SECONDS: int = _cfg.get_int("display_modes.cycle_seconds", 300)
-CLOCK_THEME: str = _cfg.get_string("display_modes.clock_theme", "stranger_things")
-CLOCK_24H: bool = _cfg.get_bool("display_modes.clock_24h", False)
-DISPLAY_MODE_CHECK_INTERVAL: int = _cfg.get_int("display_modes.mode_check_interval", 2)
-
-# Display refresh intervals
-DISPLAY_SPORTS_REFRESH_INTERVAL: int = _cfg.get_int("display_modes.sports_refresh_interval", 2)
-DISPLAY_WEATHER_REFRESH_INTERVAL: int = _cfg.get_int("display_modes.weather_refresh_interval", 2)
-DISPLAY_CLOCK_REFRESH_INTERVAL: int = _cfg.get_int("display_modes.clock_refresh_interval", 2)
-DISPLAY_STOCKS_REFRESH_INTERVAL: int = _cfg.get_int("display_modes.stocks_refresh_interval", 2)
-
-# ============================================================================
-# POWER MANAGEMENT SETTINGS
-# ============================================================================
-POWER_AUTO_OFF: bool = _cfg.get_bool("power.auto_off", True)
-POWER_OFF_TIME: str = _cfg.get_string("power.off_time", "24:00")
-POWER_ON_TIME: str = _cfg.get_string("power.on_time", "07:00")
-
-# ============================================================================
-# CLOCK THEMES
-# ============================================================================
-CLOCK_THEMES: Dict[str, Any] = _cfg.get_dict("clock_themes", {})
+# SETTINGS SCHEMA
+# ============================================================================
+# Module constant name -> (config path, type, default). Every entry becomes a
+# module-level variable below, resolved in one pass over the loaded config.
+_SCHEMA: Dict[str, Tuple[str, type, Any]] = {
+    # ========================================================================
+    # DISPLAY ADAPTER SETTINGS
+    # ========================================================================
+    "ADAPTER_TYPE": ("display.adapter", str, "ipixel"),
+
+    # iPixel Panel Settings
+    "IPIXEL_BLE_ADDRESSES": ("display.ipixel.ble_addresses", list, []),
+    "IPIXEL_BLE_UUID_WRITE": ("display.ipixel.ble_uuid_write", str, "0000fa02-0000-1000-8000-00805f9b34fb"),
+    "IPIXEL_PANEL_WIDTH": ("display.ipixel.size_width", int, 64),
+    "IPIXEL_PANEL_HEIGHT": ("display.ipixel.size_height", int, 20),
+
+    # ========================================================================
+    # WEATHER SETTINGS
+    # ========================================================================
+    "WEATHER_API_KEY": ("weather.api_key", str, "your-api-key-here"),
+    "WEATHER_CITY": ("weather.city", str, "Detroit,US"),
+    "WEATHER_UNITS": ("weather.units", str, "imperial"),
+    "WEATHER_FORECAST_MODE": ("weather.forecast_mode", str, "daily"),
+    "WEATHER_SHOW_ICONS": ("weather.show_icons", bool, True),
+    "WEATHER_CHECK_INTERVAL": ("weather.check_interval", int, 1800),
+
+    # ========================================================================
+    # SPORTS SETTINGS
+    # ========================================================================
+    "SPORTS_NHL_TEAMS": ("sports.teams.nhl", list, ["DET"]),
+    "SPORTS_NBA_TEAMS": ("sports.teams.nba", list, ["DET"]),
+    "SPORTS_NFL_TEAMS": ("sports.teams.nfl", list, ["DET"]),
+    "SPORTS_MLB_TEAMS": ("sports.teams.mlb", list, ["DET"]),
+    "SPORTS_TEST_MODE": ("sports.test_mode", bool, False),
+    "SPORTS_CHECK_INTERVAL": ("sports.check_interval", int, 10),
+    "SPORTS_SHOW_LOGOS": ("sports.show_logos", bool, True),
+    "SPORTS_MODES": ("sports.modes", list, ["live", "upcoming"]),
+
+    # ========================================================================
+    # STOCKS SETTINGS
+    # ========================================================================
+    "STOCKS_SYMBOLS": ("stocks.symbols", list, ["AAPL", "GOOGL", "MSFT"]),
+    "STOCKS_CHECK_INTERVAL": ("stocks.check_interval", int, 300),
+
+    # ========================================================================
+    # TICKER SETTINGS
+    # ========================================================================
+    "TICKER_MODES": ("ticker.modes", list, ["sports", "stocks"]),
+    "TICKER_SCROLL_SPEED": ("ticker.scroll_speed", int, 3),
+    "TICKER_REFRESH_INTERVAL": ("ticker.refresh_interval", int, 30),
+    "TICKER_HEIGHT": ("ticker.height", int, 20),
+
+    # ========================================================================
+    # DISPLAY MODES SETTINGS
+    # ========================================================================
+    "DISPLAY_SPORTS_PRIORITY": ("display_modes.sports_priority", bool, True),
+    "DISPLAY_CYCLE_MODES": ("display_modes.cycle_modes", list, ["clock", "weather"]),
+    "DISPLAY_CYCLE_SECONDS": ("display_modes.cycle_seconds", int, 300),
+    "CLOCK_THEME": ("display_modes.clock_theme", str, "stranger_things"),
+    "CLOCK_24H": ("display_modes.clock_24h", bool, False),
+    "DISPLAY_MODE_CHECK_INTERVAL": ("display_modes.mode_check_interval", int, 2),
+
+    # Display refresh intervals
+    "DISPLAY_SPORTS_REFRESH_INTERVAL": ("display_modes.sports_refresh_interval", int, 2),
+    "DISPLAY_WEATHER_REFRESH_INTERVAL": ("display_modes.weather_refresh_interval", int, 2),
+    "DISPLAY_CLOCK_REFRESH_INTERVAL": ("display_modes.clock_refresh_interval", int, 2),
+    "DISPLAY_STOCKS_REFRESH_INTERVAL": ("display_modes.stocks_refresh_interval", int, 2),
+
+    # ========================================================================
+    # POWER MANAGEMENT SETTINGS
+    # ========================================================================
+    "POWER_AUTO_OFF": ("power.auto_off", bool, True),
+    "POWER_OFF_TIME": ("power.off_time", str, "24:00"),
+    "POWER_ON_TIME": ("power.on_time", str, "07:00"),
+
+    # ========================================================================
+    # CLOCK THEMES
+    # ========================================================================
+    "CLOCK_THEMES": ("clock_themes", dict, {}),
+}
+
+globals().update({
+    name: _cfg.get_typed(path, typ, default)
+    for name, (path, typ, default) in _SCHEMA.items()
+})
 
 # ============================================================================
 # UTILITY FUNCTIONS
@@ -8,7 +8,7 @@ Loads config.yml by default, falls back to environment variables.
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger('led_panel.config_loader')
 
@@ -51,12 +51,17 @@ class ConfigLoader:
         
         self.config_path = config_path
         self._config: Dict[str, Any] = {}
+        # Every dot path (leaves and sections) -> value, built once per load so get() is one lookup
+        self._flat: Dict[str, Any] = {}
+        # Coerced typed-getter results (reset by _load_config)
+        self._typed_cache: Dict[Tuple[str, str, Any], Any] = {}
         self._load_config()
     
     def _load_config(self) -> None:
         """Load configuration from YAML file."""
         # Ensure we have an absolute path
         config_path = self.config_path.resolve() if not self.config_path.is_absolute() else self.config_path
+        self._typed_cache.clear()
         
         if config_path.exists() and YAML_AVAILABLE:
             try:
@@ -69,6 +74,8 @@ class ConfigLoader:
             logger.error("PyYAML not installed. Install with: pip install PyYAML")
         else:
             logger.error(f"{config_path} not found. Create it from config.yml.example")
+        
+        self._flat = dict(_flatten("", self._config)) if isinstance(self._config, dict) else {}
     
     def get(self, path: str, default: Any = None) -> Any:
         """
@@ -85,18 +92,40 @@ class ConfigLoader:
             loader.get("display.adapter")  # Returns "ipixel"
             loader.get("weather.api_key", "")  # Returns API key or empty string
         """
-        keys = path.split(".")
-        value = self._config
+        return self._flat.get(path, default)
+
+    def get_typed(self, path: str, typ: type, default: Any = None) -> Any:
+        """
+        Get configuration value coerced to typ (str, int, bool, list or dict).
         
+        Args:
+            path: Dot-separated path
+            typ: Target type; selects the matching get_* helper
+            default: Default value if not found or not coercible
+            
+        Returns:
+            Typed value or default
+        """
+        if typ is bool:
+            return self.get_bool(path, default)
+        if typ is int:
+            return self.get_int(path, default)
+        if typ is str:
+            return self.get_string(path, default)
+        if typ is list:
+            return self.get_list(path, default)
+        if typ is dict:
+            return self.get_dict(path, default)
+        raise TypeError(f"Unsupported config type for {path}: {typ!r}")
+
+    def _typed(self, kind: str, path: str, default: Any, convert) -> Any:
+        """Cache the coerced result of a typed getter per (kind, path, default)."""
+        key = (kind, path, default)
         try:
-            for key in keys:
-                if isinstance(value, dict):
-                    value = value[key]
-                else:
-                    return default
-            return value
-        except (KeyError, TypeError):
-            return default
+            return self._typed_cache[key]
+        except KeyError:
+            result = self._typed_cache[key] = convert(self.get(path), default)
+            return result
     
     def get_dict(self, section: str, default: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -141,12 +170,7 @@ class ConfigLoader:
         Returns:
             Boolean value or default
         """
-        value = self.get(path)
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.lower() in ("true", "yes", "1", "on")
-        return default
+        return self._typed("bool", path, default, _to_bool)
     
     def get_int(self, path: str, default: int = 0) -> int:
         """
@@ -159,13 +183,7 @@ class ConfigLoader:
         Returns:
             Integer value or default
         """
-        value = self.get(path)
-        if isinstance(value, int):
-            return value
-        try:
-            return int(value)
-        except (TypeError, ValueError):
-            return default
+        return self._typed("int", path, default, _to_int)
     
     def get_string(self, path: str, default: str = "") -> str:
         """
@@ -178,10 +196,46 @@ class ConfigLoader:
         Returns:
             String value or default
         """
-        value = self.get(path)
-        if value is None:
-            return default
-        return str(value)
+        return self._typed("string", path, default, _to_string)
+
+
+def _flatten(prefix: str, node: Dict[str, Any]):
+    """
+    Yield (dot_path, value) for every entry of a nested config dict.
+
+    Section dicts are yielded as well as their leaves, so get("weather")
+    and get_dict("weather") keep returning the whole section.
+    """
+    for key, value in node.items():
+        if not isinstance(key, str):
+            continue
+        path = f"{prefix}.{key}" if prefix else key
+        yield path, value
+        if isinstance(value, dict):
+            yield from _flatten(path, value)
+
+
+def _to_bool(value: Any, default: bool) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in ("true", "yes", "1", "on")
+    return default
+
+
+def _to_int(value: Any, default: int) -> int:
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _to_string(value: Any, default: str) -> str:
+    if value is None:
+        return default
+    return str(value)
 
 
 # Global config instance
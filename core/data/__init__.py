@@ -6,6 +6,7 @@ This package contains modules for fetching data from various sources:
 - Weather data and forecasts
 - Stock market data and quotes
 """
+import asyncio
 import os
 
 # Define constants that can be imported without triggering module dependencies
@@ -18,10 +19,11 @@ def __getattr__(name):
     if name in ('fetch_all_games', 'fetch_upcoming_games', 'get_league_letter'):
         from .sports_data import fetch_all_games, fetch_upcoming_games, get_league_letter
         return locals()[name]
-    elif name in ('fetch_current_weather', 'fetch_hourly_forecast', 'fetch_daily_forecast', 'WEATHER_API_KEY'):
+    elif name in ('fetch_current_weather', 'fetch_hourly_forecast', 'fetch_daily_forecast',
+                  'fetch_forecast_bundle', 'WEATHER_API_KEY'):
         from .weather_data import (
             fetch_current_weather, fetch_hourly_forecast, fetch_daily_forecast,
-            WEATHER_API_KEY
+            fetch_forecast_bundle, WEATHER_API_KEY
         )
         return locals()[name]
     elif name == 'fetch_stock_quotes':
@@ -29,12 +31,29 @@ def __getattr__(name):
         return fetch_stock_quotes
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
+
+async def fetch_display_data():
+    """
+    Fetch games and stock quotes concurrently.
+
+    Returns:
+        (games, quotes) tuple; either element is an Exception if that fetch failed
+    """
+    from .sports_data import fetch_all_games
+    from .stocks_data import fetch_stock_quotes
+    games, quotes = await asyncio.gather(
+        fetch_all_games(), fetch_stock_quotes(), return_exceptions=True
+    )
+    return games, quotes
+
 __all__ = [
     # Sports data
     'fetch_all_games', 'fetch_upcoming_games', 'get_league_letter',
     # Weather data
     'fetch_current_weather', 'fetch_hourly_forecast', 'fetch_daily_forecast',
-    'CITY', 'WEATHER_API_KEY',
+    'fetch_forecast_bundle', 'CITY', 'WEATHER_API_KEY',
     # Stocks data
-    'fetch_stock_quotes', 'STOCKS_SYMBOLS', 'STOCKS_CHECK_INTERVAL'
+    'fetch_stock_quotes', 'STOCKS_SYMBOLS', 'STOCKS_CHECK_INTERVAL',
+    # Combined
+    'fetch_display_data',
 ]
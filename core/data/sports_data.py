@@ -1,13 +1,32 @@
 """
 Sports data fetching from ESPN APIs
 """
+import asyncio
+from collections import namedtuple
+import functools
 import httpx
+import json
 import os
+import re
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import logging
 logger = logging.getLogger(__name__)
 
+# Optional faster JSON decoder for the (large) ESPN scoreboard payloads
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional streaming parser: builds one event at a time instead of the whole
+# scoreboard document (lower peak memory on small hosts like a Raspberry Pi)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Import configuration (loaded at startup via config.py)
 from config import (
     SPORTS_TEST_MODE as TEST_MODE_RANDOM_2,
@@ -24,6 +43,54 @@ _games_cache = {
     'ttl': 60              # Cache time-to-live in seconds
 }
 
+# Same, for the unfiltered (all teams) games shared by the ticker fetchers
+_all_games_cache = {
+    'data': None,
+    'timestamp': None,
+    'ttl': 60
+}
+_all_games_lock = None  # Created lazily so it binds to the running loop
+
+# Shared HTTP client so keep-alive connections to ESPN are reused between fetches
+_client = None
+
+
+async def get_client():
+    """Return the shared httpx client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared httpx client (call on shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# Conditional-request cache: (url, filter_teams) -> (validator headers, games).
+# Lets ESPN answer 304 Not Modified instead of resending an unchanged scoreboard.
+_conditional_cache = {}
+
+
+# Bound on concurrent ESPN requests (created lazily on the running loop)
+FETCH_CONCURRENCY = 4
+_fetch_semaphore = None
+
+
+def _get_fetch_semaphore():
+    """Return the shared fetch semaphore, creating it on first use"""
+    global _fetch_semaphore
+    if _fetch_semaphore is None:
+        _fetch_semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    return _fetch_semaphore
+
 
 def get_teams_for_league(league):
     """Get the team list for a specific league"""
@@ -35,12 +102,23 @@ def get_teams_for_league(league):
     }
     return league_map.get(league, [])
 
+
+# Uppercased team abbreviations per league for O(1) membership checks
+TEAM_SETS = {
+    league: frozenset(team.strip().upper() for team in get_teams_for_league(league))
+    for league in ("NHL", "NBA", "NFL", "MLB")
+}
+
 # --- Sports API settings ---
+# (url, league) pairs; the league is the path segment before "scoreboard"
 API_ENDPOINTS = [
-    "https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/scoreboard",
-    "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard",
-    "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard",
-    "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard"
+    (url, url.split('/')[-2].upper())
+    for url in (
+        "https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/scoreboard",
+        "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard",
+        "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard",
+        "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard",
+    )
 ]
 
 # --- League abbreviations ---
@@ -55,131 +133,168 @@ def get_league_letter(league):
     return league_map.get(league, league[:1] if league else "")
 
 
+# --- Period prefixes (quarter / period / inning) ---
+PERIOD_PREFIX = {
+    "NBA": "Q",
+    "NHL": "P",
+    "NFL": "Q",
+    "MLB": "I",
+}
+
+
+# --- Game record ---
+# One fetched game. "time" is ESPN's status detail (e.g. kickoff time for
+# scheduled games); "state" is ESPN's raw state ("pre", "in", "post", ...).
+Game = namedtuple(
+    "Game",
+    "home away home_score away_score clock period state league time",
+)
+
+
+# --- Per-league game parsers ---
+_PARSERS = {}
+
+
+def _build_league_parser(league):
+    """
+    Build the per-event parser for one league.
+
+    League constants (followed teams, period prefix) are bound once here so the
+    per-game path does no league lookups.
+
+    Returns:
+        parse(game, filter_teams, debug) -> Game, or None if the game is skipped
+    """
+    league_teams = TEAM_SETS.get(league, frozenset())
+    prefix = PERIOD_PREFIX.get(league, "")
+    test_mode = TEST_MODE_RANDOM_2
+
+    def parse(game, filter_teams, debug):
+        _get = game.get
+        short_name = _get("shortName", "")
+
+        # Parse team abbreviations first so unfollowed games skip the rest
+        away_abbr, sep, home_abbr = short_name.partition(" @ ")
+        if not sep:
+            away_abbr, sep, home_abbr = short_name.partition(" VS ")
+        if not sep:
+            return None
+
+        # Filter for your teams if requested
+        if filter_teams and not test_mode:
+            # Teams for THIS league only (prevents cross-league matches)
+            if not (away_abbr.upper() in league_teams or home_abbr.upper() in league_teams):
+                if debug:
+                    logger.debug(f"{league} Game: {away_abbr} @ {home_abbr} - Not following")
+                return None
+            if debug:
+                logger.debug(f"{league} Game: {away_abbr} @ {home_abbr} - Matched!")
+        elif filter_teams and debug:
+            logger.debug(f"Game found: {away_abbr} @ {home_abbr} (TEST MODE - including)")
+
+        comps = _get("competitions")
+        if not comps:
+            return None
+        comp = comps[0]
+
+        home_score = 0
+        away_score = 0
+        for c in comp.get("competitors", []):
+            side = c.get("homeAway")
+            score_val = c.get("score", "0")
+            if side == "home":
+                home_score = int(score_val) if score_val else 0
+            elif side == "away":
+                away_score = int(score_val) if score_val else 0
+
+        status = comp.get("status", {})
+        status_type = status.get("type", {})
+        period_raw = status.get("period", "NO_PERIOD")
+
+        # Convert period to readable format
+        try:
+            period_num = int(period_raw) if period_raw != "NO_PERIOD" else 0
+        except (TypeError, ValueError):
+            period_num = 0
+
+        return Game(
+            home_abbr, away_abbr, home_score, away_score,
+            status.get("displayClock", "0:00"),
+            f"{prefix}{period_num}" if period_num > 0 else "",
+            status_type.get("state", ""),
+            league,
+            status_type.get("detail", ""),  # Game time for scheduled games
+        )
+
+    return parse
+
+
+def _get_league_parser(league):
+    """Return the cached parser for a league, building it on first use"""
+    parse = _PARSERS.get(league)
+    if parse is None:
+        parse = _PARSERS[league] = _build_league_parser(league)
+    return parse
+
+
 # --- Fetch games from ESPN ---
-async def fetch_games_from_endpoint(url, filter_teams=True):
+def _iter_events(content):
+    """Return an iterable of scoreboard event dicts from a raw ESPN response body"""
+    if ijson is not None:
+        return ijson.items(content, "events.item", use_float=True)
+    return _json_loads(content).get("events", [])
+
+
+async def fetch_games_from_endpoint(url, league, filter_teams=True):
     """
     Fetch games from ESPN endpoint.
     
     Args:
         url: ESPN API endpoint URL
+        league: League abbreviation for the endpoint (e.g. "NHL")
         filter_teams: If True, filter for configured teams. If False, return all games.
     
     Returns:
-        List of game dicts
+        List of Game tuples
     """
-    async with httpx.AsyncClient() as client:
+    async with _get_fetch_semaphore():
         try:
-            resp = await client.get(url)
-            data = resp.json()
+            client = await get_client()
+            cache_key = (url, filter_teams)
+            cached = _conditional_cache.get(cache_key)
+            resp = await client.get(url, headers=cached[0] if cached else None)
+            if resp.status_code == 304 and cached:
+                logger.debug(f"{league} scoreboard unchanged (304)")
+                return cached[1]
+            if resp.status_code != 200:
+                # Error bodies are neither parsed nor cached; validators stay for the next poll
+                logger.warning(f"{league} scoreboard request failed: HTTP {resp.status_code}")
+                return []
+            next_events = _iter_events(resp.content)
         except Exception:
             return []
 
     games = []
-    next_events = data.get("events", [])
-    total_games_found = len(next_events)
-    league = url.split('/')[-2].upper()
-    logger.debug(f"Found {total_games_found} total games in {league} scoreboard")
+    total_games_found = 0
+    parse = _get_league_parser(league)
+    debug = logger.isEnabledFor(logging.DEBUG)  # skip per-game formatting when off
 
-    for game in next_events:
-        try:
-            short_name = game.get("shortName", "")
-            home_score = 0
-            away_score = 0
-            
-            comps = game.get("competitions", [])
-            if not comps:
-                continue
-            
-            comp = comps[0]
-            competitors = comp.get("competitors", [])
-            
-            for c in competitors:
-                score_val = c.get("score", "0")
-                if c.get("homeAway") == "home":
-                    home_score = int(score_val) if score_val else 0
-                    home_abbr = c.get("team", {}).get("abbreviation", "???")
-                elif c.get("homeAway") == "away":
-                    away_score = int(score_val) if score_val else 0
-                    away_abbr = c.get("team", {}).get("abbreviation", "???")
-            
-            status = comp.get("status", {})
-            state = status.get("type", {}).get("state", "")
-            status_name = status.get("type", {}).get("name", "")
-            
-            clock = status.get("displayClock", "0:00")
-            period_raw = status.get("period", "NO_PERIOD")
-            
-            # Convert period to readable format
+    # With ijson the body is parsed lazily, so a truncated/non-JSON body fails here
+    try:
+        for game in next_events:
+            total_games_found += 1
             try:
-                period_num = int(period_raw) if period_raw != "NO_PERIOD" else 0
-                if league == "NBA":
-                    period = "Q" + str(period_num) if period_num > 0 else ""
-                elif league == "NHL":
-                    period = "P" + str(period_num) if period_num > 0 else ""
-                elif league == "NFL":
-                    period = "Q" + str(period_num) if period_num > 0 else ""
-                elif league == "MLB":
-                    period = "I" + str(period_num) if period_num > 0 else ""
-                else:
-                    period = str(period_num) if period_num > 0 else ""
-            except:
-                period = ""
-            
-            is_completed = state in ["post", "final"]
-            period_num = int(period_raw) if period_raw != "NO_PERIOD" else 0
-            is_live = (
-                state == "inProgress" or
-                state == "in" or
-                (period_num > 0 and not is_completed)
-            )
-            
-            # Parse team abbreviations
-            if " @ " in short_name:
-                away_abbr, home_abbr = short_name.split(" @ ")
-            elif " VS " in short_name:
-                away_abbr, home_abbr = short_name.split(" VS ")
-            else:
+                parsed = parse(game, filter_teams, debug)
+            except Exception as e:
+                logger.error(f"Exception processing game {game.get('shortName', '')}: {e}")
                 continue
-            
-            # Get game time for scheduled games
-            time_detail = status.get("type", {}).get("detail", "")
-
-            # Filter for your teams if requested
-            should_include = True
-            if filter_teams:
-                if TEST_MODE_RANDOM_2:
-                    should_include = True
-                    logger.debug(f"Game found: {away_abbr} @ {home_abbr} (TEST MODE - including)")
-                else:
-                    # Get teams for THIS league only (prevents cross-league matches)
-                    league_teams = get_teams_for_league(league)
-                    team_match = any(
-                        team.upper() in away_abbr.upper() or 
-                        team.upper() in home_abbr.upper() 
-                        for team in league_teams
-                    )
-                    should_include = team_match
-                    if team_match:
-                        logger.debug(f"{league} Game: {away_abbr} @ {home_abbr} - Matched!")
-                    else:
-                        logger.debug(f"{league} Game: {away_abbr} @ {home_abbr} - Not following")
-
-            if should_include:
-                games.append({
-                    "home": home_abbr,
-                    "away": away_abbr,
-                    "home_score": home_score,
-                    "away_score": away_score,
-                    "clock": clock,
-                    "period": period,
-                    "state": state,
-                    "league": league,
-                    "time": time_detail  # Add time for upcoming games
-                })
-        except Exception as e:
-            logger.error(f"Exception processing game {short_name}: {e}")
-            continue
+            if parsed is not None:
+                games.append(parsed)
+    except Exception as e:
+        logger.error(f"Malformed {league} scoreboard response: {e}")
+        return []
 
+    logger.debug(f"Found {total_games_found} total games in {league} scoreboard")
     games_count = len(games)
     if filter_teams:
         if TEST_MODE_RANDOM_2:
@@ -188,9 +303,42 @@ async def fetch_games_from_endpoint(url, filter_teams=True):
             logger.info(f"Kept {games_count} team games (filtered from {total_games_found} found)")
     else:
         logger.debug(f"Fetched {games_count} games from {league}")
+
+    # Remember validators so the next poll can be a conditional request
+    validators = {}
+    if resp.headers.get("etag"):
+        validators["If-None-Match"] = resp.headers["etag"]
+    if resp.headers.get("last-modified"):
+        validators["If-Modified-Since"] = resp.headers["last-modified"]
+    if validators:
+        _conditional_cache[cache_key] = (validators, games)
+    else:
+        _conditional_cache.pop(cache_key, None)
     return games
 
 
+async def _fetch_endpoints(filter_teams):
+    """
+    Fetch every endpoint in API_ENDPOINTS concurrently.
+
+    A failing league is logged and skipped so the others still come through.
+
+    Returns:
+        Flat list of Game tuples across all leagues
+    """
+    results = await asyncio.gather(
+        *[fetch_games_from_endpoint(url, league, filter_teams=filter_teams) for url, league in API_ENDPOINTS],
+        return_exceptions=True,
+    )
+    all_games = []
+    for (_, league), result in zip(API_ENDPOINTS, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to fetch {league} games: {result}")
+            continue
+        all_games.extend(result)
+    return all_games
+
+
 async def _fetch_all_games_with_cache(use_cache=True):
     """
     Internal function to fetch all games with optional caching.
@@ -199,7 +347,7 @@ async def _fetch_all_games_with_cache(use_cache=True):
         use_cache: If True, return cached data if still valid
     
     Returns:
-        List of all game dicts (filtered for your teams)
+        List of all Game tuples (filtered for your teams)
     """
     global _games_cache
     
@@ -212,11 +360,7 @@ async def _fetch_all_games_with_cache(use_cache=True):
     
     # Fetch fresh data
     logger.info(f"Fetching games from {len(API_ENDPOINTS)} endpoints...")
-    all_games = []
-    for i, url in enumerate(API_ENDPOINTS):
-        logger.info(f"[{i+1}/{len(API_ENDPOINTS)}] Fetching from {url.split('/')[-2].upper()}...")
-        games = await fetch_games_from_endpoint(url, filter_teams=True)
-        all_games.extend(games)
+    all_games = await _fetch_endpoints(filter_teams=True)
     
     # Update cache
     _games_cache['data'] = all_games
@@ -226,13 +370,72 @@ async def _fetch_all_games_with_cache(use_cache=True):
     return all_games
 
 
+async def _fetch_all_unfiltered_with_cache(use_cache=True):
+    """
+    Internal function to fetch every game (all teams) with optional caching.
+
+    Shared by fetch_all_live_games() and fetch_all_upcoming_games() so calling
+    both in one cycle hits ESPN once. Concurrent callers wait for one fetch.
+
+    Args:
+        use_cache: If True, return cached data if still valid
+
+    Returns:
+        List of all Game tuples across all leagues
+    """
+    global _all_games_lock
+    if _all_games_lock is None:
+        _all_games_lock = asyncio.Lock()
+
+    async with _all_games_lock:
+        if use_cache and _all_games_cache['data'] is not None and _all_games_cache['timestamp'] is not None:
+            time_since_fetch = (datetime.now() - _all_games_cache['timestamp']).total_seconds()
+            if time_since_fetch < _all_games_cache['ttl']:
+                logger.debug(f"Using cached unfiltered game data ({int(time_since_fetch)}s old)")
+                return _all_games_cache['data']
+
+        all_games = await _fetch_endpoints(filter_teams=False)
+
+        _all_games_cache['data'] = all_games
+        _all_games_cache['timestamp'] = datetime.now()
+        return all_games
+
+
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_game_time_on(time_str, today):
+    """
+    Parse an ESPN game time string relative to the date `today` (memoized).
+
+    dateutil fills fields missing from the string (usually the year) from
+    `today`, so it is part of the cache key and entries can't go stale.
+    """
+    if _ISO_DATE.match(time_str):
+        return datetime.fromisoformat(time_str[:10]).date()
+    from dateutil import parser as date_parser
+    default = datetime(today.year, today.month, today.day)
+    return date_parser.parse(time_str, default=default).date()
+
+
+def _parse_game_time(time_str):
+    """
+    Parse an ESPN game time string to a date.
+
+    ISO dates take a fast path; anything else goes through dateutil, which
+    handles strings like "Wed, November 12th at 7:00 PM EST".
+    """
+    return _parse_game_time_on(time_str, date.today())
+
+
 async def fetch_all_games():
     """
     Fetch all games for your configured teams.
     Uses in-memory cache to avoid redundant API calls.
     
     Returns:
-        List of game dicts (all states: live, upcoming, completed)
+        List of Game tuples (all states: live, upcoming, completed)
     """
     return await _fetch_all_games_with_cache(use_cache=False)
 
@@ -246,7 +449,7 @@ async def fetch_upcoming_games(today_only=False):
         today_only: If True, only return games scheduled for today (default: True)
     
     Returns:
-        List of game dicts with 'pre' or 'STATUS_SCHEDULED' state
+        List of Game tuples with 'pre' or 'STATUS_SCHEDULED' state
     """
     # Get all games (from cache if available)
     all_games = await _fetch_all_games_with_cache(use_cache=True)
@@ -254,25 +457,21 @@ async def fetch_upcoming_games(today_only=False):
     # Filter for only upcoming games (pre-game state)
     upcoming = [
         game for game in all_games 
-        if game.get('state') in ['pre', 'STATUS_SCHEDULED']
+        if game.state in ['pre', 'STATUS_SCHEDULED']
     ]
     
     # If today_only is True, filter by date
     if today_only:
-        from dateutil import parser as date_parser
         today = datetime.now().date()
         filtered_upcoming = []
         
         for game in upcoming:
-            time_str = game.get('time', '')
+            time_str = game.time
             if not time_str:
                 continue
                 
             try:
-                # dateutil.parser handles ordinal suffixes automatically!
-                # "Wed, November 12th at 7:00 PM EST" -> datetime object
-                game_datetime = date_parser.parse(time_str)
-                game_date = game_datetime.date()
+                game_date = _parse_game_time(time_str)
                 
                 if game_date == today:
                     filtered_upcoming.append(game)
@@ -296,19 +495,15 @@ async def fetch_all_live_games():
     Perfect for ticker mode to show what's happening now.
     
     Returns:
-        List of live game dicts across all leagues
+        List of live Game tuples across all leagues
     """
     logger.info("Fetching all live games (unfiltered)...")
-    all_games = []
-    
-    for url in API_ENDPOINTS:
-        games = await fetch_games_from_endpoint(url, filter_teams=False)
-        all_games.extend(games)
+    all_games = await _fetch_all_unfiltered_with_cache()
     
     # Filter for only live games
     live_games = [
         game for game in all_games
-        if game.get('state') in ['inProgress', 'in']
+        if game.state in ['inProgress', 'in']
     ]
     
     logger.info(f"Found {len(live_games)} live games across all leagues")
@@ -321,19 +516,15 @@ async def fetch_all_upcoming_games():
     Perfect for ticker showing today's full schedule.
     
     Returns:
-        List of upcoming game dicts across all leagues
+        List of upcoming Game tuples across all leagues
     """
     logger.info("Fetching all upcoming games (unfiltered)...")
-    all_games = []
-    
-    for url in API_ENDPOINTS:
-        games = await fetch_games_from_endpoint(url, filter_teams=False)
-        all_games.extend(games)
+    all_games = await _fetch_all_unfiltered_with_cache()
     
     # Filter for only upcoming games
     upcoming = [
         game for game in all_games
-        if game.get('state') in ['pre', 'STATUS_SCHEDULED']
+        if game.state in ['pre', 'STATUS_SCHEDULED']
     ]
     
     logger.info(f"Found {len(upcoming)} upcoming games across all leagues")
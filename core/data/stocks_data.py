@@ -1,22 +1,154 @@
 """
-Stock market data fetching using Yahoo Finance (yfinance)
+Stock market data fetching from Yahoo Finance (quotes direct, screeners via yfinance)
 No API key required!
 """
 import os
 from pathlib import Path
 from datetime import datetime
 import asyncio
+import functools
+import httpx
+from itertools import chain, zip_longest
 import logging
-import yfinance as yf
+import time
 logger = logging.getLogger(__name__)
 
+# yfinance is only needed for the market screeners; watchlist quotes work without it
+try:
+    import yfinance as yf
+    YFINANCE_AVAILABLE = True
+except ImportError:
+    yf = None
+    YFINANCE_AVAILABLE = False
+
 # Import configuration (loaded at startup via config.py)
 from config import STOCKS_SYMBOLS, STOCKS_CHECK_INTERVAL
 
+# In-memory cache for stock quotes
+_quotes_cache = {
+    'data': None,                   # Cached quote list
+    'timestamp': None,              # When cache was last updated
+    'ttl': STOCKS_CHECK_INTERVAL    # Cache time-to-live in seconds
+}
+_quotes_lock = None  # Created lazily so it binds to the running loop
+
+
+# Yahoo chart endpoint: returns the live price and previous close in 'meta'
+# without the crumb/cookie handshake the v7 quote endpoint now requires
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+
+# Shared HTTP client for Yahoo (keep-alive across symbols and refreshes)
+_client = None
+
+
+async def get_client():
+    """Return the shared httpx client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10,
+            headers={'User-Agent': 'Mozilla/5.0'},  # Yahoo rejects the default UA
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared httpx client (call on shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _quotes_cache_age():
+    """Seconds since the quote cache was filled, or None if it is empty"""
+    if not _quotes_cache['data'] or _quotes_cache['timestamp'] is None:
+        return None
+    return (datetime.now() - _quotes_cache['timestamp']).total_seconds()
+
 
 async def fetch_stock_quotes():
     """
-    Fetch current stock quotes using yfinance.Tickers() (much simpler!).
+    Fetch current stock quotes, reusing results younger than the cache TTL.
+    
+    Concurrent callers share a single upstream request.
+    
+    Returns:
+        List of quote dicts (see _fetch_stock_quotes)
+    """
+    global _quotes_lock
+    if _quotes_lock is None:
+        _quotes_lock = asyncio.Lock()
+    
+    async with _quotes_lock:
+        age = _quotes_cache_age()
+        if age is not None and age < _quotes_cache['ttl']:
+            logger.debug(f"Using cached stock quotes ({int(age)}s old)")
+            return _quotes_cache['data']
+        
+        quotes = await _fetch_stock_quotes()
+        # Only cache if at least one symbol really came through; an all-placeholder
+        # result (network/Yahoo outage) would otherwise pin $0.00 for a whole TTL
+        fetched = any(q is not None for q in quotes)
+        quotes = [q or _placeholder_quote(symbol) for symbol, q in zip(STOCKS_SYMBOLS, quotes)]
+        if fetched:
+            _quotes_cache['data'] = quotes
+            _quotes_cache['timestamp'] = datetime.now()
+        return quotes
+
+
+def _placeholder_quote(symbol):
+    """Zeroed quote shown for a symbol that could not be fetched"""
+    return {
+        'symbol': symbol,
+        'price': 0,
+        'change': 0,
+        'change_percent': 0,
+        'is_up': False,
+        'name': symbol
+    }
+
+
+async def _fetch_quote(client, symbol):
+    """
+    Fetch one symbol's quote from the Yahoo chart endpoint.
+    
+    Returns:
+        Quote dict, or None if the symbol could not be fetched
+    """
+    try:
+        resp = await client.get(
+            YAHOO_CHART_URL.format(symbol=symbol),
+            params={'range': '1d', 'interval': '1d'}
+        )
+        resp.raise_for_status()
+        meta = resp.json()['chart']['result'][0]['meta']
+        
+        # Get current price and change
+        current_price = float(meta['regularMarketPrice'])
+        previous_close = float(meta.get('chartPreviousClose') or meta['previousClose'])
+        change = current_price - previous_close
+        change_percent = change / previous_close * 100
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{symbol}: ${current_price:.2f} ({change_percent:+.2f}%)")
+        return {
+            'symbol': symbol,
+            'price': current_price,
+            'change': change,
+            'change_percent': change_percent,
+            'is_up': change >= 0,
+            'name': meta.get('shortName', symbol)
+        }
+    except Exception as e:
+        logger.warning(f"Error fetching {symbol}: {e}")
+        return None
+
+
+async def _fetch_stock_quotes():
+    """
+    Fetch current stock quotes straight from Yahoo (no yfinance, no executor).
     
     Returns:
         List of dicts with stock data:
@@ -30,51 +162,14 @@ async def fetch_stock_quotes():
             },
             ...
         ]
+        with None in place of any symbol that could not be fetched
+        (fetch_stock_quotes fills in placeholders)
     """
     logger.info(f"Fetching quotes for: {', '.join(STOCKS_SYMBOLS)}")
     
     try:
-        # Run in executor to avoid blocking async loop
-        tickers = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: yf.Tickers(' '.join(STOCKS_SYMBOLS))
-        )
-        
-        quotes = []
-        for symbol in STOCKS_SYMBOLS:
-            try:
-                ticker = tickers.tickers[symbol]
-                info = ticker.info
-                
-                # Get current price and change
-                current_price = info.get('regularMarketPrice') or info.get('currentPrice', 0)
-                change = info.get('regularMarketChange', 0)
-                change_percent = info.get('regularMarketChangePercent', 0)
-                
-                quote = {
-                    'symbol': symbol,
-                    'price': current_price,
-                    'change': change,
-                    'change_percent': change_percent,
-                    'is_up': change >= 0,
-                    'name': info.get('shortName', symbol)
-                }
-                
-                quotes.append(quote)
-                logger.debug(f"{symbol}: ${current_price:.2f} ({change_percent:+.2f}%)")
-                
-            except Exception as e:
-                logger.warning(f"Error parsing {symbol}: {e}")
-                # Add placeholder
-                quotes.append({
-                    'symbol': symbol,
-                    'price': 0,
-                    'change': 0,
-                    'change_percent': 0,
-                    'is_up': False,
-                    'name': symbol
-                })
-        
+        client = await get_client()
+        quotes = await asyncio.gather(*(_fetch_quote(client, symbol) for symbol in STOCKS_SYMBOLS))
         logger.info(f"Fetched {len(quotes)} stock quotes")
         return quotes
         
@@ -83,6 +178,32 @@ async def fetch_stock_quotes():
         return []
 
 
+# Market status per minute of the week: index weekday*1440 + hour*60 + minute
+_MARKET_STATUSES = ("closed", "open", "pre-market")
+
+
+def _build_market_table():
+    """
+    Precompute the status code (index into _MARKET_STATUSES) for every minute.
+    
+    Market hours: 9:30 AM - 4:00 PM EST
+    Pre-market: 4:00 AM - 9:30 AM EST
+    After-hours counts as closed, as do weekends.
+    
+    This is a simplified version - doesn't account for holidays
+    or timezone differences
+    """
+    table = bytearray(7 * 1440)  # 0 = closed
+    for weekday in range(5):  # Monday-Friday
+        day = weekday * 1440
+        table[day + 4 * 60:day + 9 * 60 + 30] = b"\x02" * (5 * 60 + 30)
+        table[day + 9 * 60 + 30:day + 16 * 60] = b"\x01" * (6 * 60 + 30)
+    return bytes(table)
+
+
+_MARKET_TABLE = _build_market_table()
+
+
 def get_market_status():
     """
     Determine if market is open or closed.
@@ -90,31 +211,8 @@ def get_market_status():
     Returns:
         str: "open", "closed", or "pre-market"
     """
-    now = datetime.now()
-    weekday = now.weekday()  # 0=Monday, 6=Sunday
-    hour = now.hour
-    minute = now.minute
-    
-    # Weekend
-    if weekday >= 5:  # Saturday or Sunday
-        return "closed"
-    
-    # Weekday - check time (EST)
-    # Market hours: 9:30 AM - 4:00 PM EST
-    # Pre-market: 4:00 AM - 9:30 AM EST
-    # After-hours: 4:00 PM - 8:00 PM EST
-    
-    # This is a simplified version - doesn't account for holidays
-    # or timezone differences
-    
-    if (hour == 9 and minute >= 30) or (hour >= 10 and hour < 16):
-        return "open"
-    elif hour >= 4 and hour < 9:
-        return "pre-market"
-    elif hour == 9 and minute < 30:
-        return "pre-market"
-    else:
-        return "closed"
+    now = time.localtime()  # plain struct; no datetime object needed for a table index
+    return _MARKET_STATUSES[_MARKET_TABLE[now.tm_wday * 1440 + now.tm_hour * 60 + now.tm_min]]
 
 
 if __name__ == "__main__":
@@ -138,61 +236,116 @@ if __name__ == "__main__":
 # MARKET DATA FOR TICKER MODE
 # ============================================================================
 
-async def fetch_market_gainers(limit=10):
+# Screener results are reused for this many seconds
+SCREENER_CACHE_TTL = 60
+
+
+def _screener_cache(fn):
     """
-    Fetch top gaining stocks today using yfinance screener API.
+    TTL-cache a screener fetch(limit) coroutine.
+
+    Screener results are ranked, so a fresh result fetched with a larger limit
+    also answers smaller limits (sliced). Empty results are not cached, and
+    concurrent callers of the same screener share one request.
+    """
+    cache = {}  # limit -> (monotonic timestamp, quotes)
+    lock = None
+
+    @functools.wraps(fn)
+    async def wrapper(limit=10):
+        nonlocal lock
+        if lock is None:
+            lock = asyncio.Lock()
+        
+        async with lock:
+            now = time.monotonic()
+            for cached_limit, (timestamp, quotes) in cache.items():
+                if cached_limit >= limit and now - timestamp < SCREENER_CACHE_TTL:
+                    logger.debug(f"Using cached {fn.__name__} data ({int(now - timestamp)}s old)")
+                    return quotes[:limit]
+            
+            quotes = await fn(limit)
+            if quotes:
+                cache.clear()  # older entries are superseded
+                cache[limit] = (time.monotonic(), quotes)
+            return quotes
+
+    return wrapper
+
+
+async def _fetch_screener(kind, label, limit, summarize):
+    """
+    Fetch one of yfinance's predefined screeners and convert it to our quote format.
     
     Args:
+        kind: Screener name ("day_gainers", "day_losers", "most_actives")
+        label: Human-readable name for log messages
         limit: Maximum number of stocks to return (max 250)
+        summarize: Formats one quote for the log summary line
     
     Returns:
-        List of stock quote dicts sorted by % gain
+        List of stock quote dicts in screener order
     """
+    if not YFINANCE_AVAILABLE:
+        logger.warning(f"yfinance not installed - cannot fetch market {label}")
+        return []
     
     try:
-        logger.info(f"Fetching top {limit} gainers from yfinance screener...")
+        logger.info(f"Fetching top {limit} {label} from yfinance screener...")
         
-        # Use yfinance predefined screener for day_gainers
         # Run in executor to avoid blocking async loop
         response = await asyncio.get_event_loop().run_in_executor(
             None,
-            lambda: yf.screen("day_gainers", count=limit)
+            lambda: yf.screen(kind, count=limit)
         )
         
         if not response or 'quotes' not in response:
-            logger.warning("No gainers data returned from screener")
+            logger.warning(f"No {label} data returned from screener")
             return []
         
         quotes_data = response['quotes']
-        logger.info(f"Screener returned {len(quotes_data)} gainers")
+        logger.info(f"Screener returned {len(quotes_data)} {label}")
         
         # Convert to our quote format
-        quotes = []
-        for quote_data in quotes_data[:limit]:
-            try:
-                symbol = quote_data.get('symbol', '')
-                price = quote_data.get('regularMarketPrice', 0)
-                change_pct = quote_data.get('regularMarketChangePercent', 0)
-                
-                quotes.append({
-                    'symbol': symbol,
-                    'price': price,
-                    'change_percent': change_pct,
-                    'is_up': change_pct > 0
-                })
-            except Exception as e:
-                logger.debug(f"Error parsing gainer {quote_data.get('symbol', 'unknown')}: {e}")
-                continue
+        # (missing/null fields default to 0 so one odd row can't sink the batch)
+        quotes = [
+            {
+                'symbol': q.get('symbol', ''),
+                'price': q.get('regularMarketPrice') or 0,
+                'change_percent': q.get('regularMarketChangePercent') or 0,
+                'is_up': (q.get('regularMarketChangePercent') or 0) > 0
+            }
+            for q in quotes_data[:limit]
+        ]
         
-        gainer_list = ', '.join([f"{q['symbol']} +{q['change_percent']:.1f}%" for q in quotes[:5]])
-        logger.info(f"Top {len(quotes)} gainers: {gainer_list}...")
+        if logger.isEnabledFor(logging.INFO):
+            summary = ', '.join(summarize(q) for q in quotes[:5])
+            logger.info(f"Top {len(quotes)} {label}: {summary}...")
         
         return quotes
     except Exception as e:
-        logger.error(f"Error fetching market gainers: {e}")
+        logger.error(f"Error fetching market {label}: {e}")
         return []
 
 
+@_screener_cache
+async def fetch_market_gainers(limit=10):
+    """
+    Fetch top gaining stocks today using yfinance screener API.
+    
+    Args:
+        limit: Maximum number of stocks to return (max 250)
+    
+    Returns:
+        List of stock quote dicts sorted by % gain
+    """
+    return await _fetch_screener(
+        "day_gainers", "gainers", limit,
+        lambda q: f"{q['symbol']} +{q['change_percent']:.1f}%"
+    )
+
+
+@_screener_cache
 async def fetch_market_losers(limit=10):
     """
     Fetch top losing stocks today using yfinance screener API.
@@ -203,50 +356,13 @@ async def fetch_market_losers(limit=10):
     Returns:
         List of stock quote dicts sorted by % loss
     """
-    
-    try:
-        logger.info(f"Fetching top {limit} losers from yfinance screener...")
-        
-        # Use yfinance predefined screener for day_losers
-        response = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: yf.screen("day_losers", count=limit)
-        )
-        
-        if not response or 'quotes' not in response:
-            logger.warning("No losers data returned from screener")
-            return []
-        
-        quotes_data = response['quotes']
-        logger.info(f"Screener returned {len(quotes_data)} losers")
-        
-        # Convert to our quote format
-        quotes = []
-        for quote_data in quotes_data[:limit]:
-            try:
-                symbol = quote_data.get('symbol', '')
-                price = quote_data.get('regularMarketPrice', 0)
-                change_pct = quote_data.get('regularMarketChangePercent', 0)
-                
-                quotes.append({
-                    'symbol': symbol,
-                    'price': price,
-                    'change_percent': change_pct,
-                    'is_up': change_pct > 0
-                })
-            except Exception as e:
-                logger.debug(f"Error parsing loser {quote_data.get('symbol', 'unknown')}: {e}")
-                continue
-        
-        loser_list = ', '.join([f"{q['symbol']} {q['change_percent']:.1f}%" for q in quotes[:5]])
-        logger.info(f"Top {len(quotes)} losers: {loser_list}...")
-        
-        return quotes
-    except Exception as e:
-        logger.error(f"Error fetching market losers: {e}")
-        return []
+    return await _fetch_screener(
+        "day_losers", "losers", limit,
+        lambda q: f"{q['symbol']} {q['change_percent']:.1f}%"
+    )
 
 
+@_screener_cache
 async def fetch_market_active(limit=10):
     """
     Fetch most actively traded stocks using yfinance screener API.
@@ -257,48 +373,30 @@ async def fetch_market_active(limit=10):
     Returns:
         List of stock quote dicts sorted by volume
     """
+    return await _fetch_screener(
+        "most_actives", "most active", limit,
+        lambda q: q['symbol']
+    )
+
+
+async def fetch_market_movers(limit=10):
+    """
+    Fetch the day's top gainers and losers together.
     
-    try:
-        logger.info(f"Fetching top {limit} most active from yfinance screener...")
-        
-        # Use yfinance predefined screener for most_actives
-        response = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: yf.screen("most_actives", count=limit)
-        )
-        
-        if not response or 'quotes' not in response:
-            logger.warning("No active stocks data returned from screener")
-            return []
-        
-        quotes_data = response['quotes']
-        logger.info(f"Screener returned {len(quotes_data)} most active stocks")
-        
-        # Convert to our quote format
-        quotes = []
-        for quote_data in quotes_data[:limit]:
-            try:
-                symbol = quote_data.get('symbol', '')
-                price = quote_data.get('regularMarketPrice', 0)
-                change_pct = quote_data.get('regularMarketChangePercent', 0)
-                
-                quotes.append({
-                    'symbol': symbol,
-                    'price': price,
-                    'change_percent': change_pct,
-                    'is_up': change_pct > 0
-                })
-            except Exception as e:
-                logger.debug(f"Error parsing active stock {quote_data.get('symbol', 'unknown')}: {e}")
-                continue
-        
-        active_list = ', '.join([f"{q['symbol']}" for q in quotes[:5]])
-        logger.info(f"Top {len(quotes)} most active: {active_list}...")
-        
-        return quotes
-    except Exception as e:
-        logger.error(f"Error fetching most active stocks: {e}")
-        return []
+    Both screeners are requested concurrently and go through the screener
+    cache, so callers polling within SCREENER_CACHE_TTL share one fetch of each.
+    
+    Args:
+        limit: Maximum number of stocks per side
+    
+    Returns:
+        Dict with 'gainers' (best first) and 'losers' (worst first)
+    """
+    gainers, losers = await asyncio.gather(
+        fetch_market_gainers(limit),
+        fetch_market_losers(limit)
+    )
+    return {'gainers': gainers, 'losers': losers}
 
 
 async def fetch_market_mixed(limit=10):
@@ -312,17 +410,12 @@ async def fetch_market_mixed(limit=10):
         List alternating gainers and losers
     """
     half = limit // 2
-    gainers = await fetch_market_gainers(half)
-    losers = await fetch_market_losers(limit - half)
+    movers = await fetch_market_movers(max(half, limit - half))
+    gainers = movers['gainers'][:half]
+    losers = movers['losers'][:limit - half]
     
     # Interleave gainers and losers
-    mixed = []
-    for i in range(max(len(gainers), len(losers))):
-        if i < len(gainers):
-            mixed.append(gainers[i])
-        if i < len(losers):
-            mixed.append(losers[i])
+    mixed = [q for q in chain.from_iterable(zip_longest(gainers, losers)) if q is not None]
     
     logger.info(f"Mixed market data: {len(mixed)} stocks (gainers + losers)")
     return mixed
-
@@ -1,8 +1,13 @@
 """
 Weather data fetching from OpenWeatherMap API
 """
+from array import array
+import asyncio
+from collections import Counter
+import functools
 import httpx
 import os
+import time
 from datetime import datetime
 from pathlib import Path
 from PIL import Image
@@ -15,6 +20,59 @@ from config import WEATHER_API_KEY, WEATHER_CITY as CITY, WEATHER_UNITS as UNITS
 # Alias for backward compatibility
 OPENWEATHER_API_KEY = WEATHER_API_KEY
 
+# Shared HTTP client so keep-alive connections to OpenWeatherMap are reused
+_client = None
+
+
+async def get_client():
+    """Return the shared httpx client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared httpx client (call on shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# Response cache: (endpoint, city, units) -> (monotonic timestamp, parsed result)
+# OpenWeatherMap data changes on ~10 minute granularity, so poll no faster than this
+CURRENT_WEATHER_TTL = 600
+FORECAST_TTL = 1800
+_cache = {}
+_cache_locks = {}  # Per-key locks, created on first use inside the running loop
+
+
+async def _cached(key, ttl, fetch):
+    """
+    Return the cached result for key if younger than ttl, else await fetch() and cache it.
+
+    Falsy results (errors) are not cached. Concurrent callers share one fetch.
+    """
+    lock = _cache_locks.get(key)
+    if lock is None:
+        lock = _cache_locks[key] = asyncio.Lock()
+    
+    async with lock:
+        entry = _cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            logger.debug(f"Using cached {key[0]} data ({int(time.monotonic() - entry[0])}s old)")
+            return entry[1]
+        
+        result = await fetch()
+        if result:
+            _cache[key] = (time.monotonic(), result)
+        return result
+
+
 # --- Weather condition colors ---
 WEATHER_COLORS = {
     "clear": (255, 255, 0),      # Yellow for sunny
@@ -41,7 +99,17 @@ WEATHER_ICONS = {
 
 
 def load_weather_icon(condition, size=(12, 12)):
-    """Load and resize weather icon for given condition"""
+    """
+    Load and resize weather icon for given condition.
+
+    Results are cached per (condition, size); treat the returned image as read-only.
+    """
+    return _load_weather_icon(condition, tuple(size))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_weather_icon(condition, size):
+    """Load and resize weather icon (uncached; see load_weather_icon)"""
     icon_path = WEATHER_ICONS.get(condition, WEATHER_ICONS["default"])
     try:
         icon = Image.open(icon_path).convert("RGBA")
@@ -52,82 +120,190 @@ def load_weather_icon(condition, size=(12, 12)):
         return None
 
 
-def get_icon_pixels(icon, offset=(0, 0)):
-    """Convert icon to list of (x, y, r, g, b) tuples for non-transparent pixels"""
+def get_icon_pixels(icon, offset=(0, 0), as_array=False):
+    """
+    Convert icon to list of (x, y, r, g, b) tuples for non-transparent pixels.
+
+    With as_array=True, return (xs, ys, rgb) instead: two signed array('i')
+    coordinate arrays (offsets may be negative, e.g. an icon partly off-canvas)
+    and packed RGB bytes, ready for a buffer-based blitter (e.g.
+    numpy.frombuffer) without per-pixel tuples.
+    """
     if icon is None:
-        return []
+        return (array("i"), array("i"), b"") if as_array else []
+    
+    if icon.mode != "RGBA":
+        icon = icon.convert("RGBA")
     
-    pixels = []
-    for y in range(icon.height):
-        for x in range(icon.width):
-            r, g, b, a = icon.getpixel((x, y))
-            if a > 128:  # Only draw non-transparent pixels
-                pixels.append((offset[0] + x, offset[1] + y, r, g, b))
-    return pixels
+    # One bulk copy of the RGBA bytes instead of a getpixel() call per pixel
+    data = icon.tobytes()
+    width = icon.width
+    ox, oy = offset
+    # Only draw non-transparent pixels
+    opaque = [i for i, alpha in enumerate(data[3::4]) if alpha > 128]
+    
+    if as_array:
+        rgba = memoryview(data)
+        return (
+            array("i", [ox + i % width for i in opaque]),
+            array("i", [oy + i // width for i in opaque]),
+            b"".join([rgba[i * 4:i * 4 + 3] for i in opaque]),
+        )
+    return [
+        (ox + i % width, oy + i // width, data[i * 4], data[i * 4 + 1], data[i * 4 + 2])
+        for i in opaque
+    ]
 
 
 async def fetch_current_weather():
+    """Fetch current weather from OpenWeatherMap (cached for CURRENT_WEATHER_TTL)"""
+    return await _cached(("weather", CITY, UNITS), CURRENT_WEATHER_TTL, _fetch_current_weather)
+
+
+async def _fetch_current_weather():
     """Fetch current weather from OpenWeatherMap"""
     url = f"https://api.openweathermap.org/data/2.5/weather?q={CITY}&appid={OPENWEATHER_API_KEY}&units={UNITS}"
     
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.get(url)
-            data = resp.json()
-            
-            if resp.status_code != 200:
-                logger.error(f"WeatherAPIerror:{data.get('message','Unknownerror')}")
-                return None
-            
-            weather = {
-                "temp": round(data["main"]["temp"]),
-                "feels_like": round(data["main"]["feels_like"]),
-                "temp_min": round(data["main"]["temp_min"]),
-                "temp_max": round(data["main"]["temp_max"]),
-                "humidity": data["main"]["humidity"],
-                "description": data["weather"][0]["description"].title(),
-                "condition": data["weather"][0]["main"].lower(),
-                "wind_speed": round(data["wind"]["speed"]),
-                "city": data["name"]
-            }
-            
-            logger.info(f"☀Weather:{weather['temp']}°F,{weather['description']}")
-            return weather
-            
-        except Exception as e:
-            logger.error(f"Errorfetchingweather:{e}")
+    try:
+        client = await get_client()
+        resp = await client.get(url)
+        data = resp.json()
+        
+        if resp.status_code != 200:
+            logger.error(f"WeatherAPIerror:{data.get('message','Unknownerror')}")
+            return None
+        
+        weather = {
+            "temp": round(data["main"]["temp"]),
+            "feels_like": round(data["main"]["feels_like"]),
+            "temp_min": round(data["main"]["temp_min"]),
+            "temp_max": round(data["main"]["temp_max"]),
+            "humidity": data["main"]["humidity"],
+            "description": data["weather"][0]["description"].title(),
+            "condition": data["weather"][0]["main"].lower(),
+            "wind_speed": round(data["wind"]["speed"]),
+            "city": data["name"]
+        }
+        
+        logger.info(f"☀Weather:{weather['temp']}°F,{weather['description']}")
+        return weather
+        
+    except Exception as e:
+        logger.error(f"Errorfetchingweather:{e}")
+        return None
+
+
+async def _fetch_forecast_items():
+    """
+    Fetch the full 5-day / 3-hour forecast list (40 items).
+
+    Returns:
+        List of raw forecast items, or None on error
+    """
+    url = f"https://api.openweathermap.org/data/2.5/forecast?q={CITY}&appid={OPENWEATHER_API_KEY}&units={UNITS}"
+    
+    try:
+        client = await get_client()
+        resp = await client.get(url)
+        data = resp.json()
+        
+        if resp.status_code != 200:
+            logger.error(f"ForecastAPIerror:{data.get('message','Unknownerror')}")
             return None
+        
+        return data["list"]
+        
+    except Exception as e:
+        logger.error(f"Errorfetchingforecast:{e}")
+        return None
+
+
+def _hourly_from_items(items):
+    """Build the next-4-hours forecast from raw forecast items"""
+    forecasts = []
+    for item in items[:4]:
+        time = datetime.fromtimestamp(item["dt"]).strftime("%I%p").lstrip("0")
+        forecasts.append({
+            "time": time,
+            "temp": round(item["main"]["temp"]),
+            "condition": item["weather"][0]["main"].lower(),
+            "description": item["weather"][0]["description"]
+        })
+    return forecasts
+
+
+def _daily_from_items(items):
+    """
+    Build the next-2-days forecast from raw forecast items.
+    Returns high temp for each day with most common condition.
+    """
+    # Group forecasts by local calendar day (dicts keep chronological order).
+    # time.localtime is cheap; day names are only formatted for the days kept.
+    days = {}
+    for item in items:
+        local = time.localtime(item["dt"])
+        key = (local.tm_year, local.tm_yday)
+        day = days.get(key)
+        if day is None:
+            day = days[key] = (local, [], [])
+        day[1].append(item["main"]["temp"])
+        day[2].append(item["weather"][0]["main"].lower())
+    
+    # Create daily forecasts (skip today, get next 2 days)
+    today = datetime.now().strftime("%a")
+    forecasts = []
+    
+    for local, temps, conditions in list(days.values())[1:3]:  # Skip first (today), get next 2
+        day_key = time.strftime("%a", local)  # "Mon", "Tue", etc.
+        if day_key == today:
+            continue
+        
+        # Get high temp for the day
+        high_temp = round(max(temps))
+        
+        # Most common condition
+        condition = Counter(conditions).most_common(1)[0][0]
+        
+        forecasts.append({
+            "time": day_key,  # Day name
+            "temp": high_temp,
+            "condition": condition,
+            "description": condition.title()
+        })
+    
+    return forecasts[:2]  # Return only 2 days
+
+
+async def fetch_forecast_bundle():
+    """
+    Fetch the forecast once and derive both hourly and daily views from it.
+    Cached for FORECAST_TTL.
+
+    Returns:
+        {"hourly": [...next 4 hours], "daily": [...next 2 days]}; empty lists on error
+    """
+    items = await _cached(("forecast", CITY, UNITS), FORECAST_TTL, _fetch_forecast_items)
+    if items is None:
+        return {"hourly": [], "daily": []}
+    
+    try:
+        hourly = _hourly_from_items(items)
+    except Exception as e:
+        logger.error(f"Errorfetchingforecast:{e}")
+        hourly = []
+    try:
+        daily = _daily_from_items(items)
+    except Exception as e:
+        logger.error(f"Errorfetchingdailyforecast:{e}")
+        daily = []
+    return {"hourly": hourly, "daily": daily}
 
 
 async def fetch_hourly_forecast():
     """Fetch hourly forecast (next 4 hours)"""
-    url = f"https://api.openweathermap.org/data/2.5/forecast?q={CITY}&appid={OPENWEATHER_API_KEY}&units={UNITS}&cnt=4"
-    
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.get(url)
-            data = resp.json()
-            
-            if resp.status_code != 200:
-                logger.error(f"ForecastAPIerror:{data.get('message','Unknownerror')}")
-                return []
-            
-            forecasts = []
-            for item in data["list"]:
-                time = datetime.fromtimestamp(item["dt"]).strftime("%I%p").lstrip("0")
-                forecasts.append({
-                    "time": time,
-                    "temp": round(item["main"]["temp"]),
-                    "condition": item["weather"][0]["main"].lower(),
-                    "description": item["weather"][0]["description"]
-                })
-            
-            logger.info(f"📅Fetched{len(forecasts)}hourforecast")
-            return forecasts
-            
-        except Exception as e:
-            logger.error(f"Errorfetchingforecast:{e}")
-            return []
+    forecasts = (await fetch_forecast_bundle())["hourly"]
+    logger.info(f"📅Fetched{len(forecasts)}hourforecast")
+    return forecasts
 
 
 async def fetch_daily_forecast():
@@ -135,54 +311,6 @@ async def fetch_daily_forecast():
     Fetch daily forecast (next 2 days).
     Returns high temp for each day with most common condition.
     """
-    # Get extended forecast (40 items = ~5 days of 3-hour intervals)
-    url = f"https://api.openweathermap.org/data/2.5/forecast?q={CITY}&appid={OPENWEATHER_API_KEY}&units={UNITS}"
-    
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.get(url)
-            data = resp.json()
-            
-            if resp.status_code != 200:
-                logger.error(f"ForecastAPIerror:{data.get('message','Unknownerror')}")
-                return []
-            
-            # Group forecasts by day
-            from collections import defaultdict
-            daily_data = defaultdict(lambda: {"temps": [], "conditions": []})
-            
-            for item in data["list"]:
-                dt = datetime.fromtimestamp(item["dt"])
-                day_key = dt.strftime("%a")  # "Mon", "Tue", etc.
-                
-                daily_data[day_key]["temps"].append(item["main"]["temp"])
-                daily_data[day_key]["conditions"].append(item["weather"][0]["main"].lower())
-            
-            # Create daily forecasts (skip today, get next 2 days)
-            today = datetime.now().strftime("%a")
-            forecasts = []
-            
-            for day_key, day_info in list(daily_data.items())[1:3]:  # Skip first (today), get next 2
-                if day_key == today:
-                    continue
-                
-                # Get high temp for the day
-                high_temp = round(max(day_info["temps"]))
-                
-                # Most common condition
-                condition = max(set(day_info["conditions"]), key=day_info["conditions"].count)
-                
-                forecasts.append({
-                    "time": day_key,  # Day name
-                    "temp": high_temp,
-                    "condition": condition,
-                    "description": condition.title()
-                })
-            
-            logger.info(f"📅Fetched{len(forecasts)}dayforecast")
-            return forecasts[:2]  # Return only 2 days
-            
-        except Exception as e:
-            logger.error(f"Errorfetchingdailyforecast:{e}")
-            return []
-
+    forecasts = (await fetch_forecast_bundle())["daily"]
+    logger.info(f"📅Fetched{len(forecasts)}dayforecast")
+    return forecasts
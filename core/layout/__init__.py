@@ -1,8 +1,8 @@
 """
 Layout template system for flexible display rendering.
 """
-from .template import LayoutTemplate, ElementSpec, GameLayoutTemplate, StockLayoutTemplate
+from .template import Align, LayoutTemplate, ElementSpec, GameLayoutTemplate, StockLayoutTemplate
 from .loader import LayoutLoader
 
-__all__ = ['LayoutTemplate', 'ElementSpec', 'GameLayoutTemplate', 'StockLayoutTemplate', 'LayoutLoader']
+__all__ = ['Align', 'LayoutTemplate', 'ElementSpec', 'GameLayoutTemplate', 'StockLayoutTemplate', 'LayoutLoader']
 
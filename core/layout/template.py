@@ -1,15 +1,48 @@
 """
 Layout template data structures.
 """
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
+from enum import IntEnum
+from functools import lru_cache
 from typing import Optional, Dict, Any, Tuple
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+; older
+# interpreters fall back to regular dataclasses.
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+class Align(IntEnum):
+    """Horizontal alignment of an element's x offset."""
+    LEFT = 0
+    RIGHT = 1
+    CENTER = 2
+
+
+# Config spellings; anything unrecognized falls back to left alignment
+_ALIGN_MAP = {'left': Align.LEFT, 'right': Align.RIGHT, 'center': Align.CENTER}
+
+# ElementSpec config keys and defaults, in constructor (field) order
+_ELEMENT_FIELDS = (
+    ('x', 0),
+    ('y', 0),
+    ('width', None),
+    ('height', None),
+    ('font_size', 10),
+    ('color', 'white'),
+    ('align', 'left'),
+    ('format', None),
+    ('anchor', None),
+)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ElementSpec:
     """
     Specification for a single UI element (logo, text, score, etc.)
     
+    Immutable once loaded; use dataclasses.replace() to derive variants.
+    
     Attributes:
         x: X position (pixels from left)
         y: Y position (pixels from top)
@@ -17,9 +50,11 @@ class ElementSpec:
         height: Optional height constraint
         font_size: Font size in pixels
         color: Color name or RGB tuple (resolved at render time)
-        align: Text alignment ("left", "right", "center")
+        align: Text alignment (Align; "left"/"right"/"center" accepted)
         format: Format string for text (e.g., "{abbr} {score}")
         anchor: PIL anchor point for text ("lt", "rt", etc.)
+        resolved_pos: (x, y) baked in by LayoutTemplate.finalize() for the
+            template's canvas width, or None if not finalized
     """
     x: int = 0
     y: int = 0
@@ -27,24 +62,22 @@ class ElementSpec:
     height: Optional[int] = None
     font_size: int = 10
     color: str = "white"  # Color name, resolved at render time
-    align: str = "left"
+    align: Align = Align.LEFT
     format: Optional[str] = None
     anchor: Optional[str] = None
+    resolved_pos: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Resolve config strings once so per-frame checks are int compares
+        if not isinstance(self.align, Align):
+            object.__setattr__(self, 'align', _ALIGN_MAP.get(self.align, Align.LEFT))
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ElementSpec':
         """Create ElementSpec from config dict."""
-        return cls(
-            x=data.get('x', 0),
-            y=data.get('y', 0),
-            width=data.get('width'),
-            height=data.get('height'),
-            font_size=data.get('font_size', 10),
-            color=data.get('color', 'white'),
-            align=data.get('align', 'left'),
-            format=data.get('format'),
-            anchor=data.get('anchor'),
-        )
+        values = [data.get(key, default) for key, default in _ELEMENT_FIELDS]
+        # YAML yields RGB colors as lists; store tuples so specs stay hashable
+        return cls(*[tuple(v) if isinstance(v, list) else v for v in values])
     
     def get_position(self, parent_width: int = 0) -> Tuple[int, int]:
         """
@@ -56,18 +89,29 @@ class ElementSpec:
         Returns:
             (x, y) tuple
         """
-        x = self.x
-        if self.align == "right" and parent_width > 0:
-            # x is offset from right edge
-            x = parent_width - self.x
-        elif self.align == "center" and parent_width > 0:
-            # x is offset from center
-            x = (parent_width // 2) + self.x
-        
-        return (x, self.y)
+        return _resolve_position(self, parent_width)
+    
+    def resolve(self, parent_width: int):
+        """Bake get_position(parent_width) into resolved_pos."""
+        object.__setattr__(self, 'resolved_pos', _resolve_position(self, parent_width))
+
+
+# x resolvers indexed by Align: left is absolute, right is an offset from the
+# right edge, center an offset from the middle (parent width 0 = unknown)
+_POSITION_RESOLVERS = (
+    lambda x, width: x,
+    lambda x, width: width - x if width > 0 else x,
+    lambda x, width: (width // 2) + x if width > 0 else x,
+)
+
 
+@lru_cache(maxsize=512)
+def _resolve_position(spec: ElementSpec, parent_width: int) -> Tuple[int, int]:
+    """Resolve an aligned spec to absolute (x, y); specs are frozen, so cacheable."""
+    return (_POSITION_RESOLVERS[spec.align](spec.x, parent_width), spec.y)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class GameLayoutTemplate:
     """
     Layout template for rendering a single game (sports).
@@ -114,7 +158,7 @@ class GameLayoutTemplate:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StockLayoutTemplate:
     """Layout template for rendering a single stock quote."""
     symbol: Optional[ElementSpec] = None
@@ -138,7 +182,7 @@ class StockLayoutTemplate:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LayoutTemplate:
     """
     Complete layout template for a display mode.
@@ -194,6 +238,7 @@ class LayoutTemplate:
             if 'four_stocks' in data:
                 template.four_items = cls._load_multi_template(data['four_stocks'], StockLayoutTemplate)
         
+        template.finalize()
         return template
     
     @staticmethod
@@ -222,6 +267,27 @@ class LayoutTemplate:
         
         return result
     
+    def finalize(self):
+        """
+        Resolve every element's aligned position against canvas_width.
+        
+        Call once the scenario templates are assembled, so renderers can read
+        spec.resolved_pos instead of recomputing alignment each frame.
+        """
+        for scenario in (self.one_item, self.two_items, self.three_items, self.four_items, self.multi_items):
+            if isinstance(scenario, dict):
+                item_templates = [scenario.get('item_template')] + list(scenario.get('items') or ())
+            else:
+                item_templates = [scenario]
+            
+            for item_template in item_templates:
+                if item_template is None:
+                    continue
+                for f in fields(item_template):
+                    spec = getattr(item_template, f.name)
+                    if isinstance(spec, ElementSpec):
+                        spec.resolve(self.canvas_width)
+    
     def get_template_for_count(self, count: int) -> Optional[Any]:
         """
         Get appropriate template based on item count.
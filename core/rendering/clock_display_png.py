@@ -3,6 +3,7 @@ Custom clock rendering with theme support (PNG upload)
 """
 from PIL import Image, ImageDraw, ImageFont
 from datetime import datetime
+import io
 import json
 import os
 from pathlib import Path
@@ -66,7 +67,72 @@ BUILT_IN_THEMES = {
 THEMES = {**BUILT_IN_THEMES, **load_custom_themes()}
 
 
-def render_clock(width=64, height=20, theme="stranger_things", hour24=False):
+# Raw TTF data for every font the themes reference, read from disk once at import
+# (all built-in themes share the same file)
+_TTF_BYTES = {
+    path: Path(path).read_bytes()
+    for theme in THEMES.values()
+    for path in (theme.get("font_time"), theme.get("font_date"))
+    if path and os.path.exists(path)
+}
+
+# Loaded fonts keyed by (path, size); truetype() reparses the TTF file on every call
+_font_cache = {}
+
+# Rendered clock frames keyed by (width, height, theme, time string, date string).
+# The output only changes once a minute, so a handful of entries is plenty.
+_frame_cache = {}
+_FRAME_CACHE_SIZE = 4
+
+
+# Per-theme text widths: theme -> {"time_widths": {text: px}, "date_widths": {text: px}}
+_layout = {}
+
+
+def _text_width(theme, kind, font, text):
+    """Width of text in font, measured once per (theme, kind, text) and then looked up."""
+    widths = _layout.setdefault(theme, {"time_widths": {}, "date_widths": {}})[kind]
+    width = widths.get(text)
+    if width is None:
+        bbox = font.getbbox(text)
+        width = widths[text] = bbox[2] - bbox[0]
+    return width
+
+
+# Blank canvases keyed by (mode, size, color); new frames start as a copy of one of these
+_blank_cache = {}
+
+
+def _new_image(mode, size, color):
+    """
+    Return a fresh image filled with color, cloned from a cached blank canvas.
+
+    Copying a prefilled canvas is a straight buffer copy instead of Image.new's
+    per-pixel fill. Every call returns an independent image, so frames kept in
+    _frame_cache are never overwritten by later renders.
+    """
+    key = (mode, size, color)
+    blank = _blank_cache.get(key)
+    if blank is None:
+        blank = _blank_cache[key] = Image.new(mode, size, color=color)
+    return blank.copy()
+
+
+def _load_font(path, size):
+    """Load a TrueType font once per (path, size), falling back to PIL's default font."""
+    key = (path, size)
+    font = _font_cache.get(key)
+    if font is None:
+        try:
+            ttf = _TTF_BYTES.get(path)
+            font = ImageFont.truetype(io.BytesIO(ttf) if ttf is not None else path, size)
+        except OSError:
+            font = ImageFont.load_default()
+        _font_cache[key] = font
+    return font
+
+
+def render_clock(width=64, height=20, theme="stranger_things", hour24=False, out=None, origin=(0, 0), now=None):
     """
     Render a themed clock display.
     
@@ -75,26 +141,27 @@ def render_clock(width=64, height=20, theme="stranger_things", hour24=False):
         height: Display height (default 20 for top panel)
         theme: Theme name from THEMES dict
         hour24: Use 24-hour format (True) or 12-hour with AM/PM (False)
+        out: Optional RGB image to render into instead of returning a new one
+        origin: Top-left corner of the clock within out
+        now: Time to display (default: current time)
     
     Returns:
-        PIL Image (RGB mode)
+        PIL Image (RGB mode) - out itself when given
     """
+    frame = _clock_frame(width, height, theme, hour24, now)
+    if out is not None:
+        out.paste(frame, origin)
+        return out
+    return frame.copy()
+
+
+def _clock_frame(width, height, theme, hour24, now=None):
+    """Render (or fetch from _frame_cache) the clock frame; the result is shared, don't modify it."""
     theme_config = THEMES.get(theme, THEMES["classic"])
     
-    # Create image
-    img = Image.new('RGB', (width, height), color=theme_config["bg_color"])
-    draw = ImageDraw.Draw(img)
-    
-    # Load fonts
-    try:
-        time_font = ImageFont.truetype(theme_config["font_time"], theme_config["time_size"])
-        date_font = ImageFont.truetype(theme_config["font_date"], theme_config["date_size"])
-    except OSError:
-        time_font = ImageFont.load_default()
-        date_font = ImageFont.load_default()
-    
     # Get current time
-    now = datetime.now()
+    if now is None:
+        now = datetime.now()
     
     # Format time string
     if hour24:
@@ -107,35 +174,54 @@ def render_clock(width=64, height=20, theme="stranger_things", hour24=False):
     # Format date string (abbreviated for small display)
     date_str = now.strftime("%a %m/%d")  # e.g., "Mon 11/10"
     
+    # Same minute, same theme and size: reuse the frame rendered earlier
+    cache_key = (width, height, theme, time_str, date_str)
+    cached = _frame_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Create image
+    img = _new_image('RGB', (width, height), tuple(theme_config["bg_color"]))
+    draw = ImageDraw.Draw(img)
+    
+    # Load fonts
+    time_font = _load_font(theme_config["font_time"], theme_config["time_size"])
+    date_font = _load_font(theme_config["font_date"], theme_config["date_size"])
+    
     # Draw time (top portion of display)
-    time_bbox = time_font.getbbox(time_str)
-    time_width = time_bbox[2] - time_bbox[0]
+    time_width = _text_width(theme, "time_widths", time_font, time_str)
     time_x = (width - time_width) // 2
     time_y = -2  # Move up to eliminate top padding
     
     # Add glow effect if enabled
     if theme_config.get("glow"):
         glow_color = theme_config["glow_color"]
-        # Draw glow slightly offset
+        # Rasterize the time once into a mask (1px margin so offset copies aren't clipped),
+        # then stamp the glow color through it slightly offset
+        mask = _new_image('L', (width + 2, height + 2), 0)
+        ImageDraw.Draw(mask).text((time_x + 1, time_y + 1), time_str, fill=255, font=time_font)
         for offset in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-            draw.text((time_x + offset[0], time_y + offset[1]), time_str, 
-                     fill=glow_color, font=time_font)
+            img.paste(glow_color, (offset[0] - 1, offset[1] - 1), mask)
     
     # Draw main time text
     draw.text((time_x, time_y), time_str, fill=theme_config["time_color"], font=time_font)
     
     # Draw date at bottom (if space allows)
     if height >= 20:
-        date_bbox = date_font.getbbox(date_str)
-        date_width = date_bbox[2] - date_bbox[0]
+        date_width = _text_width(theme, "date_widths", date_font, date_str)
         date_x = (width - date_width) // 2
         date_y = height - 8  # Very bottom of display
         draw.text((date_x, date_y), date_str, fill=theme_config["date_color"], font=date_font)
     
+    # Evict the oldest entry once the cache is full (dicts keep insertion order)
+    if len(_frame_cache) >= _FRAME_CACHE_SIZE:
+        del _frame_cache[next(iter(_frame_cache))]
+    _frame_cache[cache_key] = img
+    
     return img
 
 
-def render_clock_with_weather_split(current_weather, forecasts, total_width=64, total_height=40, theme="stranger_things", hour24=False):
+def render_clock_with_weather_split(current_weather, forecasts, total_width=64, total_height=40, theme="stranger_things", hour24=False, now=None):
     """
     Render clock on top panel and weather on bottom panel.
 
@@ -146,6 +232,7 @@ def render_clock_with_weather_split(current_weather, forecasts, total_width=64,
         total_height: Total display height (default 40 for dual panels)
         theme: Clock theme name
         hour24: Use 24-hour format
+        now: Time to display (default: current time)
 
     Returns:
         PIL Image (RGB mode)
@@ -156,16 +243,15 @@ def render_clock_with_weather_split(current_weather, forecasts, total_width=64,
     panel_height = total_height // 2
     panel_width = total_width
 
-    # Create full image
-    img = Image.new('RGB', (total_width, total_height), color=(0, 0, 0))
+    # Create full image; both halves are rendered straight into it
+    img = _new_image('RGB', (total_width, total_height), (0, 0, 0))
 
     # Render clock on top panel
-    clock_img = render_clock(width=panel_width, height=panel_height, theme=theme, hour24=hour24)
-    img.paste(clock_img, (0, 0))
+    render_clock(width=panel_width, height=panel_height, theme=theme, hour24=hour24, out=img, origin=(0, 0), now=now)
 
     # Render weather on bottom panel
-    weather_img = render_weather_bottom_panel(current_weather, forecasts, width=panel_width, height=panel_height)
-    img.paste(weather_img, (0, panel_height))
+    render_weather_bottom_panel(current_weather, forecasts, width=panel_width, height=panel_height,
+                                out=img, origin=(0, panel_height))
 
     return img
 
@@ -279,16 +279,16 @@ def render_game_with_logos(img, game, width=64, height=40):
         team_font = score_font
         small_font = score_font
     
-    home_name = game["home"]
-    away_name = game["away"]
-    home_score = str(game["home_score"])
-    away_score = str(game["away_score"])
-    clock = game.get("clock", "")
-    period = game.get("period", "")
-    league = game.get("league", "")
+    home_name = game.home
+    away_name = game.away
+    home_score = str(game.home_score)
+    away_score = str(game.away_score)
+    clock = game.clock
+    period = game.period
+    league = game.league
     
     # Check if game is over
-    game_state = game.get("state", "")
+    game_state = game.state
     is_game_over = game_state in ["post", "completed", "final"]
     
     if is_game_over:
@@ -358,19 +358,19 @@ def render_game_expanded(draw, game, offset=(0,0), width=64, font=None, small_fo
     if small_font is None:
         small_font = font
     
-    home_name = game["home"]
-    away_name = game["away"]
-    home_score = str(game["home_score"])
-    away_score = str(game["away_score"])
-    clock = game.get("clock", "")
-    period = game.get("period", "")
+    home_name = game.home
+    away_name = game.away
+    home_score = str(game.home_score)
+    away_score = str(game.away_score)
+    clock = game.clock
+    period = game.period
     
     # Shorten team names
     home_abbr = home_name[:3]
     away_abbr = away_name[:3]
     
     # Check if game is over
-    game_state = game.get("state", "")
+    game_state = game.state
     is_game_over = game_state in ["post", "completed", "final"]
     
     if is_game_over:
@@ -431,17 +431,17 @@ def render_game_compact(draw, game, offset=(0,0), width=64, font=None):
         except OSError:
             font = ImageFont.load_default()
     
-    home_name = game["home"]
-    away_name = game["away"]
-    home_score = str(game["home_score"])
-    away_score = str(game["away_score"])
+    home_name = game.home
+    away_name = game.away
+    home_score = str(game.home_score)
+    away_score = str(game.away_score)
     
     # Shorten team names
     home_abbr = home_name[:3]
     away_abbr = away_name[:3]
     
     # Check if game is over
-    game_state = game.get("state", "")
+    game_state = game.state
     is_game_over = game_state in ["post", "completed", "final"]
     
     if is_game_over:
@@ -588,7 +588,7 @@ def render_upcoming_games(games, width=64, height=40):
     - 3-4 games: Compact format with mini logos, 10px per game
     
     Args:
-        games: List of upcoming game dicts from fetch_upcoming_games()
+        games: List of upcoming Game tuples from fetch_upcoming_games()
         width: Image width (default 64)
         height: Image height (default 40)
     
@@ -624,10 +624,10 @@ def render_upcoming_games(games, width=64, height=40):
     if num_games == 1:
         # Single game - large format with logos (similar to live games)
         game = games[0]
-        away = game['away']
-        home = game['home']
-        time = game['time']
-        league = game['league']
+        away = game.away
+        home = game.home
+        time = game.time
+        league = game.league
         
         # Away team logo (top half)
         away_logo = load_team_logo(away, league, max_size=(16, 16))
@@ -661,10 +661,10 @@ def render_upcoming_games(games, width=64, height=40):
         # Two games - stacked format with logos side-by-side (20px each)
         for idx, game in enumerate(games):
             y_offset = idx * 20
-            away = game['away']
-            home = game['home']
-            time = game['time']
-            league = game['league']
+            away = game.away
+            home = game.home
+            time = game.time
+            league = game.league
             
             # Away logo (small, 10x10) on left
             away_logo = load_team_logo(away, league, max_size=(10, 10))
@@ -698,10 +698,10 @@ def render_upcoming_games(games, width=64, height=40):
         # 3-4 games - compact format with mini logos (10px each)
         for idx, game in enumerate(games):
             y_offset = idx * 10
-            away = game['away']
-            home = game['home']
-            time = game['time']
-            league = game['league']
+            away = game.away
+            home = game.home
+            time = game.time
+            league = game.league
             
             # Away logo (mini, 8x8)
             away_logo = load_team_logo(away, league, max_size=(8, 8))
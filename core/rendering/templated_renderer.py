@@ -7,7 +7,7 @@ from PIL import Image, ImageDraw, ImageFont
 from typing import Dict, Any, Optional, Tuple, List
 import logging
 
-from core.layout import LayoutTemplate, GameLayoutTemplate, StockLayoutTemplate, ElementSpec
+from core.layout import Align, LayoutTemplate, GameLayoutTemplate, StockLayoutTemplate, ElementSpec
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +68,7 @@ def load_font(size: int, font_path: str = "./fonts/PixelOperator.ttf") -> ImageF
         return ImageFont.load_default()
 
 
-def render_element_text(draw: ImageDraw, spec: ElementSpec, text: str, context: Dict[str, Any], canvas_width: int):
+def render_element_text(draw: ImageDraw, spec: ElementSpec, text: str, context: Dict[str, Any], canvas_width: int, y_offset: int = 0):
     """
     Render a text element using its spec.
     
@@ -78,20 +78,22 @@ def render_element_text(draw: ImageDraw, spec: ElementSpec, text: str, context:
         text: Text to render
         context: Runtime context for color resolution
         canvas_width: Canvas width for alignment
+        y_offset: Vertical offset (row position in multi-item layouts)
     """
     if not spec:
         return
     
     font = load_font(spec.font_size)
     color = resolve_color(spec.color, context)
-    x, y = spec.get_position(canvas_width)
+    x, y = spec.resolved_pos or spec.get_position(canvas_width)
+    y += y_offset
     
     # Handle right alignment
-    if spec.align == 'right':
+    if spec.align == Align.RIGHT:
         bbox = font.getbbox(text)
         text_width = bbox[2] - bbox[0]
         x = x - text_width
-    elif spec.align == 'center':
+    elif spec.align == Align.CENTER:
         bbox = font.getbbox(text)
         text_width = bbox[2] - bbox[0]
         x = x - (text_width // 2)
@@ -155,7 +157,7 @@ class TemplatedSportsRenderer:
         Render games using appropriate template.
         
         Args:
-            games: List of game dicts
+            games: List of Game tuples
             display_type: 'live' or 'upcoming'
         
         Returns:
@@ -189,10 +191,10 @@ class TemplatedSportsRenderer:
         # Prepare context for color resolution
         from core.rendering.sports_display_png import get_team_color, load_team_logo
         
-        league = game.get('league', '')
-        away_name = game['away']
-        home_name = game['home']
-        is_game_over = game.get('state', '') in ['post', 'completed', 'final']
+        league = game.league
+        away_name = game.away
+        home_name = game.home
+        is_game_over = game.state in ['post', 'completed', 'final']
         
         context = {
             'away_color': (150, 150, 150) if is_game_over else get_team_color(away_name, league, (0, 255, 0)),
@@ -208,7 +210,7 @@ class TemplatedSportsRenderer:
             render_element_logo(img, template.away_logo, logo)
         
         if template.away_score:
-            render_element_text(draw, template.away_score, str(game.get('away_score', 0)), context, self.width)
+            render_element_text(draw, template.away_score, str(game.away_score), context, self.width)
         
         if template.away_name:
             render_element_text(draw, template.away_name, away_name, context, self.width)
@@ -222,7 +224,7 @@ class TemplatedSportsRenderer:
             render_element_logo(img, template.home_logo, logo)
         
         if template.home_score:
-            render_element_text(draw, template.home_score, str(game.get('home_score', 0)), context, self.width)
+            render_element_text(draw, template.home_score, str(game.home_score), context, self.width)
         
         if template.home_name:
             render_element_text(draw, template.home_name, home_name, context, self.width)
@@ -230,17 +232,17 @@ class TemplatedSportsRenderer:
         # Render game status
         if display_type == 'live':
             if template.period:
-                period_text = "END" if is_game_over else game.get('period', '')
+                period_text = "END" if is_game_over else game.period
                 if period_text:
                     render_element_text(draw, template.period, period_text, context, self.width)
             
             if template.clock and not is_game_over:
-                clock_text = game.get('clock', '')
+                clock_text = game.clock
                 if clock_text:
                     render_element_text(draw, template.clock, clock_text, context, self.width)
         else:  # upcoming
             if template.time:
-                time_text = game.get('time', '')
+                time_text = game.time
                 render_element_text(draw, template.time, time_text, context, self.width)
     
     def _render_multi_games(self, img: Image, games: List[Dict[str, Any]], scenario_template: Dict[str, Any], display_type: str):
@@ -267,65 +269,55 @@ class TemplatedSportsRenderer:
             y_offset = idx * item_height
             
             # Prepare context
-            league = game.get('league', '')
-            away_name = game['away']
-            home_name = game['home']
-            is_game_over = game.get('state', '') in ['post', 'completed', 'final']
+            league = game.league
+            away_name = game.away
+            home_name = game.home
+            is_game_over = game.state in ['post', 'completed', 'final']
             
             context = {
                 'away_color': (150, 150, 150) if is_game_over else get_team_color(away_name, league, (0, 255, 0)),
                 'home_color': (150, 150, 150) if is_game_over else get_team_color(home_name, league, (255, 0, 0)),
             }
             
-            # Helper to offset element specs
-            def offset_spec(spec: Optional[ElementSpec], y_off: int) -> Optional[ElementSpec]:
-                if not spec:
-                    return None
-                # Create new spec with y offset
-                import copy
-                new_spec = copy.copy(spec)
-                new_spec.y = spec.y + y_off
-                return new_spec
-            
             # Render away team
             if game_template.away_text:
                 # Combined text (e.g., "DET 5")
                 away_abbr = away_name[:3]
-                away_score = game.get('away_score', 0)
+                away_score = game.away_score
                 text = format_text(game_template.away_text.format, {
                     'abbr': away_abbr,
                     'name': away_name,
                     'score': away_score
                 })
-                render_element_text(draw, offset_spec(game_template.away_text, y_offset), text, context, self.width)
+                render_element_text(draw, game_template.away_text, text, context, self.width, y_offset)
             elif game_template.away_score:
                 # Separate score
-                render_element_text(draw, offset_spec(game_template.away_score, y_offset), str(game.get('away_score', 0)), context, self.width)
+                render_element_text(draw, game_template.away_score, str(game.away_score), context, self.width, y_offset)
             
             # Render home team
             if game_template.home_text:
                 home_abbr = home_name[:3]
-                home_score = game.get('home_score', 0)
+                home_score = game.home_score
                 text = format_text(game_template.home_text.format, {
                     'abbr': home_abbr,
                     'name': home_name,
                     'score': home_score
                 })
-                render_element_text(draw, offset_spec(game_template.home_text, y_offset), text, context, self.width)
+                render_element_text(draw, game_template.home_text, text, context, self.width, y_offset)
             elif game_template.home_score:
-                render_element_text(draw, offset_spec(game_template.home_score, y_offset), str(game.get('home_score', 0)), context, self.width)
+                render_element_text(draw, game_template.home_score, str(game.home_score), context, self.width, y_offset)
             
             # Render game status
             if display_type == 'live':
                 if game_template.period:
-                    period_text = "END" if is_game_over else game.get('period', '')
+                    period_text = "END" if is_game_over else game.period
                     if period_text:
-                        render_element_text(draw, offset_spec(game_template.period, y_offset), period_text, context, self.width)
+                        render_element_text(draw, game_template.period, period_text, context, self.width, y_offset)
                 
                 if game_template.clock and not is_game_over:
-                    clock_text = game.get('clock', '')
+                    clock_text = game.clock
                     if clock_text:
-                        render_element_text(draw, offset_spec(game_template.clock, y_offset), clock_text, context, self.width)
+                        render_element_text(draw, game_template.clock, clock_text, context, self.width, y_offset)
 
 
 class TemplatedStocksRenderer:
@@ -415,17 +407,8 @@ class TemplatedStocksRenderer:
             is_up = quote.get('is_up', True)
             context = {'is_up': is_up}
             
-            # Helper to offset specs
-            def offset_spec(spec: Optional[ElementSpec], y_off: int) -> Optional[ElementSpec]:
-                if not spec:
-                    return None
-                import copy
-                new_spec = copy.copy(spec)
-                new_spec.y = spec.y + y_off
-                return new_spec
-            
             if stock_template.symbol:
-                render_element_text(draw, offset_spec(stock_template.symbol, y_offset), quote['symbol'][:4], context, self.width)
+                render_element_text(draw, stock_template.symbol, quote['symbol'][:4], context, self.width, y_offset)
             
             if stock_template.price:
                 price = quote['price']
@@ -435,12 +418,12 @@ class TemplatedStocksRenderer:
                     price_text = f"${price:.0f}"
                 else:
                     price_text = f"${price:.2f}"
-                render_element_text(draw, offset_spec(stock_template.price, y_offset), price_text, context, self.width)
+                render_element_text(draw, stock_template.price, price_text, context, self.width, y_offset)
             
             if stock_template.change or stock_template.change_percent:
                 arrow = "▲" if is_up else "▼"
                 change_pct = quote['change_percent']
                 change_text = f"{arrow}{abs(change_pct):.1f}%"
                 spec = stock_template.change or stock_template.change_percent
-                render_element_text(draw, offset_spec(spec, y_offset), change_text, context, self.width)
+                render_element_text(draw, spec, change_text, context, self.width, y_offset)
 
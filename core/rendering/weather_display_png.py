@@ -138,17 +138,27 @@ def render_weather(current, forecasts, width=64, height=40):
     return img
 
 
-def render_weather_bottom_panel(current, forecasts, width=64, height=20):
+def render_weather_bottom_panel(current, forecasts, width=64, height=20, out=None, origin=(0, 0)):
     """
     Render simplified weather for bottom panel only (when clock is on top).
     Shows current temp + upcoming forecasts.
 
     Layout adapts to width: [Current] [Forecast1] [Forecast2...]
 
+    Args:
+        out: Optional RGB image to render into instead of a new one; the
+             width x height area at origin is cleared to black first
+        origin: Top-left corner of the panel within out
+
     Returns:
-        PIL Image (RGB mode)
+        PIL Image (RGB mode) - out itself when given
     """
-    img = Image.new('RGB', (width, height), color=(0, 0, 0))
+    ox, oy = origin
+    if out is None:
+        img = Image.new('RGB', (width, height), color=(0, 0, 0))
+    else:
+        img = out
+        img.paste((0, 0, 0), (ox, oy, ox + width, oy + height))
     draw = ImageDraw.Draw(img)
 
     try:
@@ -167,36 +177,36 @@ def render_weather_bottom_panel(current, forecasts, width=64, height=20):
     # --- Current Weather (leftmost section) ---
     if current:
         temp_color = get_temp_color(current['temp'])
-        x_offset = 0
+        x_offset = ox
 
         # Small icon
         icon = load_weather_icon(current["condition"], size=(10, 10))
         if icon:
-            draw._image.paste(icon, (x_offset + 1, 1), icon if icon.mode == 'RGBA' else None)
+            draw._image.paste(icon, (x_offset + 1, oy + 1), icon if icon.mode == 'RGBA' else None)
 
         # Current temp
         temp_text = f"{current['temp']}"
-        draw.text((x_offset + 13, 1), temp_text, fill=temp_color, font=font)
+        draw.text((x_offset + 13, oy + 1), temp_text, fill=temp_color, font=font)
 
         # "NOW" label
-        draw.text((x_offset + 2, 11), "NOW", fill=(100, 100, 100), font=small_font)
+        draw.text((x_offset + 2, oy + 11), "NOW", fill=(100, 100, 100), font=small_font)
 
     # --- Forecasts ---
     for i, forecast in enumerate(forecasts[:2]):
-        x_offset = (i + 1) * section_width
+        x_offset = ox + (i + 1) * section_width
 
         # Tiny icon
         icon = load_weather_icon(forecast["condition"], size=(8, 8))
         if icon:
-            draw._image.paste(icon, (x_offset + 2, 2), icon if icon.mode == 'RGBA' else None)
+            draw._image.paste(icon, (x_offset + 2, oy + 2), icon if icon.mode == 'RGBA' else None)
 
         # Temperature
         temp_text = f"{forecast['temp']}"
-        draw.text((x_offset + 12, 0), temp_text, fill=(200, 200, 200), font=forecast_font)
+        draw.text((x_offset + 12, oy + 0), temp_text, fill=(200, 200, 200), font=forecast_font)
 
         # Time (hour only)
         time_text = forecast['time'][:5]  # "HH:MM"
-        draw.text((x_offset + 3, 11), time_text, fill=(100, 100, 100), font=small_font)
+        draw.text((x_offset + 3, oy + 11), time_text, fill=(100, 100, 100), font=small_font)
 
     return img
 
@@ -2,6 +2,7 @@
 Display Manager using Mode pattern.
 """
 import asyncio
+import sys
 from datetime import datetime
 import logging
 import logging_config
@@ -215,7 +216,7 @@ class DisplayManager:
                             await self.adapter.upload_gif(gif_bytes)
                             logger.info("Ticker GIF uploaded (looping on display)")
                 elif result.image:
-                    await self.adapter.upload_image(result.image, clear_first=False)
+                    await self.adapter.upload_image(result.image, clear_first=False, cache_key=result.cache_key)
                     logger.info(f"{target_mode_name} displayed")
                 
                 # Handle static page cycling for ticker mode
@@ -257,6 +258,10 @@ class DisplayManager:
         finally:
             await self.adapter.disconnect()
             logger.info("Disconnected from display")
+            for module_name in ('core.data.sports_data', 'core.data.stocks_data', 'core.data.weather_data'):
+                data_module = sys.modules.get(module_name)
+                if data_module is not None:
+                    await data_module.close_client()
 
 
 async def main():
@@ -275,4 +280,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Optional: libuv-based event loop, faster for the HTTP/BLE I/O this process does
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
@@ -15,6 +15,7 @@ class ModeResult:
     should_skip: bool = False  # True if mode has no data to display
     priority: bool = False  # True if this mode should override cycling
     state_changed: bool = False  # True if underlying data changed
+    cache_key: Optional[tuple] = None  # Identifies the image content (same key = same pixels)
 
 
 class BaseMode(ABC):
@@ -102,6 +103,18 @@ class BaseMode(ABC):
         """
         pass
     
+    def cache_key(self, width: int, height: int, now: datetime) -> Optional[tuple]:
+        """
+        Key identifying what render() would produce right now, if the mode can tell.
+        
+        Modes whose output depends only on a few inputs (e.g. the clock) can return a
+        hashable key here; the adapter then reuses the encoded frame for repeat keys.
+        
+        Returns:
+            Hashable tuple, or None if the content can't be keyed (default)
+        """
+        return None
+    
     @abstractmethod
     def has_priority(self) -> bool:
         """
@@ -143,7 +156,8 @@ class BaseMode(ABC):
         return ModeResult(
             image=image,
             priority=self.has_priority(),
-            state_changed=True
+            state_changed=True,
+            cache_key=self.cache_key(width, height, now) if image is not None else None
         )
     
     def reset_state(self):
@@ -6,7 +6,7 @@ from typing import Optional
 from PIL import Image
 import logging
 
-from .base_mode import BaseMode
+from .base_mode import BaseMode, ModeResult
 from core.data import fetch_current_weather, fetch_hourly_forecast, fetch_daily_forecast
 from core.rendering import render_clock_with_weather_split
 
@@ -20,6 +20,7 @@ class ClockMode(BaseMode):
         super().__init__("clock", config)
         self.current_weather = None
         self.forecasts = None
+        self.frame_time = None  # `now` of the current update(); render and cache_key share it
         
         # Config
         self.weather_check_interval = config.get('WEATHER_CHECK_INTERVAL', 300)
@@ -59,6 +60,11 @@ class ClockMode(BaseMode):
             return True
         return (now - self.last_render).total_seconds() >= self.refresh_interval
     
+    async def update(self, width: int, height: int, now: datetime) -> ModeResult:
+        """Pin the displayed time to `now` so the frame and its cache key agree."""
+        self.frame_time = now
+        return await super().update(width, height, now)
+    
     async def render(self, width: int, height: int) -> Optional[Image.Image]:
         """Render clock + weather."""
         return render_clock_with_weather_split(
@@ -67,9 +73,15 @@ class ClockMode(BaseMode):
             total_width=width,
             total_height=height,
             theme=self.theme,
-            hour24=self.hour24
+            hour24=self.hour24,
+            now=self.frame_time
         )
     
+    def cache_key(self, width: int, height: int, now: datetime) -> Optional[tuple]:
+        """The frame only changes with the minute, the theme and fresh weather data."""
+        return (self.name, width, height, self.theme, self.hour24,
+                now.strftime("%Y-%m-%d %H:%M"), self.last_fetch)
+    
     def has_priority(self) -> bool:
         """Clock never has priority."""
         return False
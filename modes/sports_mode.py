@@ -132,14 +132,14 @@ class SportsMode(BaseMode):
         """Get only in-progress games."""
         return [
             g for g in self.games
-            if g.get('state') in ['inProgress', 'in']
+            if g.state in ['inProgress', 'in']
         ]
     
     def _get_upcoming_games(self):
         """Get only upcoming/scheduled games."""
         return [
             g for g in self.games
-            if g.get('state') in ['pre', 'STATUS_SCHEDULED']
+            if g.state in ['pre', 'STATUS_SCHEDULED']
         ]
     
     def _prepare_display_games(self, now: datetime):
@@ -198,13 +198,13 @@ class SportsMode(BaseMode):
         
         if self.display_type == 'live':
             return [
-                (g['home'], g['away'], g.get('home_score'), g.get('away_score'),
-                 g.get('period'), g.get('clock'), g.get('state'))
+                (g.home, g.away, g.home_score, g.away_score,
+                 g.period, g.clock, g.state)
                 for g in self.display_games
             ]
         else:  # upcoming
             return [
-                (g['home'], g['away'], g.get('time'), g.get('state'))
+                (g.home, g.away, g.time, g.state)
                 for g in self.display_games
             ]
 
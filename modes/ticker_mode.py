@@ -93,21 +93,16 @@ class TickerMode(BaseMode):
         """Fetch data for single-panel ticker (original behavior)."""
         self.segments = []
         
-        # Collect ticker segments from configured modes
+        # Collect ticker segments from configured modes (fetched concurrently)
+        fetches = []
         if 'sports' in self.ticker_modes:
-            segment = await self._fetch_sports_segment_single()
-            if segment:
-                self.segments.append(segment)
-        
+            fetches.append(self._fetch_sports_segment_single())
         if 'stocks' in self.ticker_modes:
-            segment = await self._fetch_stocks_segment_single()
-            if segment:
-                self.segments.append(segment)
-        
+            fetches.append(self._fetch_stocks_segment_single())
         if 'weather' in self.ticker_modes:
-            segment = await self._fetch_weather_segment()
-            if segment:
-                self.segments.append(segment)
+            fetches.append(self._fetch_weather_segment())
+        
+        self.segments = [segment for segment in await asyncio.gather(*fetches) if segment]
         
         self.last_fetch = datetime.now()
         return len(self.segments) > 0
@@ -119,19 +114,16 @@ class TickerMode(BaseMode):
         
         logger.info(f"Fetching ticker data for panel {self.ticker_panel_idx}: {self.ticker_modes}")
         
+        fetches = []
         if 'sports' in self.ticker_modes:
-            segment = await self._fetch_sports_segment_ticker()
-            if segment:
-                self.ticker_segments.append(segment)
-        
+            fetches.append(self._fetch_sports_segment_ticker())
         if 'stocks' in self.ticker_modes:
-            segment = await self._fetch_stocks_segment_ticker()
-            if segment:
-                self.ticker_segments.append(segment)
+            fetches.append(self._fetch_stocks_segment_ticker())
         
-        # Fetch static panel data
+        # Fetch static panel data alongside the ticker segments
         logger.info(f"Fetching static data for panel {self.static_panel_idx}: {self.static_mode}")
-        self.static_data = await self._fetch_static_panel_data()
+        *segments, self.static_data = await asyncio.gather(*fetches, self._fetch_static_panel_data())
+        self.ticker_segments = [segment for segment in segments if segment]
         
         self.last_fetch = datetime.now()
         
@@ -730,11 +722,11 @@ class TickerMode(BaseMode):
         current_x = x_offset
         
         for game in games:
-            away = game['away']
-            home = game['home']
-            time_str = game.get('time', 'TBD')
-            league = game.get('league', '')
-            state = game.get('state', '')
+            away = game.away
+            home = game.home
+            time_str = game.time
+            league = game.league
+            state = game.state
             
             # Get team colors
             away_color = get_team_color(away, league, (200, 200, 200))
@@ -765,8 +757,8 @@ class TickerMode(BaseMode):
             
             if state in ['inProgress', 'in']:
                 # Live game - show scores in yellow
-                score_text = f"{game.get('away_score', 0)}-{game.get('home_score', 0)}"
-                period = game.get('period', '')
+                score_text = f"{game.away_score}-{game.home_score}"
+                period = game.period
                 if period:
                     score_text += f" {period}"
                 draw.text((current_x, y_center), score_text, fill=(255, 255, 0), font=font)